@@ -432,7 +432,7 @@ async def status_command(interaction: discord.Interaction):
         # Get orchestrator status if available
         orchestrator_status = {}
         if bot_instance.orchestrator:
-            orchestrator_status = bot_instance.orchestrator.get_status()
+            orchestrator_status = await bot_instance.orchestrator.get_status()
 
         # Create status message
         status_lines = ["📊 **Nexus CLI System Status**", "", "📋 **Task Queues:**"]
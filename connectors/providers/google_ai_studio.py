@@ -1,9 +1,11 @@
 """Google AI Studio API provider with multi-key rotation."""
 
+import atexit
 import json
 import logging
 import os
 import time
+import weakref
 from pathlib import Path
 
 import httpx
@@ -12,6 +14,21 @@ from .base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between key index writes; rotations in between are flushed
+# by the next write or at exit
+_KEY_INDEX_SAVE_INTERVAL = 1.0
+
+# Providers holding a deferred key index write, flushed once at exit; weak so
+# the exit hook does not keep discarded providers alive
+_pending_saves: "weakref.WeakSet[GoogleAiStudioProvider]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_saves():
+    """Write every key index whose save is still deferred."""
+    for provider in list(_pending_saves):
+        provider._flush_key_index()
+
 
 class GoogleAiStudioProvider(BaseProvider):
     """Provider for Google AI Studio API with key rotation."""
@@ -35,6 +52,7 @@ class GoogleAiStudioProvider(BaseProvider):
 
         # Load current key index
         self.current_key_index = self._load_key_index()
+        self._last_save = float("-inf")
 
     def _load_api_keys(self) -> list[str]:
         """Load API keys from environment variables."""
@@ -60,11 +78,39 @@ class GoogleAiStudioProvider(BaseProvider):
                 pass
         return 0
 
+    @property
+    def current_key_index(self) -> int:
+        """Index of the key in use, always within range of api_keys."""
+        return self._current_key_index
+
+    @current_key_index.setter
+    def current_key_index(self, value: int):
+        # Normalize once here (cached indexes may exceed a shrunken key list)
+        # so reads on the request path need no bounds arithmetic
+        self._current_key_index = value % (len(self.api_keys) or 1)
+
     def _save_key_index(self):
-        """Save the current key index to cache."""
+        """Save the current key index to cache, at most once per interval."""
+        if time.monotonic() - self._last_save < _KEY_INDEX_SAVE_INTERVAL:
+            # A 429 storm rotates repeatedly; persist the latest index later
+            _pending_saves.add(self)
+            return
+        self._write_key_index()
+
+    def _flush_key_index(self):
+        """Write a key index whose save was deferred."""
+        if self in _pending_saves:
+            self._write_key_index()
+
+    def _write_key_index(self):
+        """Atomically replace the key index cache file."""
+        self._last_save = time.monotonic()
+        _pending_saves.discard(self)
+        tmp_file = self.key_index_file.with_name(f"{self.key_index_file.name}.tmp")
         try:
-            with open(self.key_index_file, "w") as f:
+            with open(tmp_file, "w") as f:
                 json.dump({"current_index": self.current_key_index}, f)
+            tmp_file.replace(self.key_index_file)
         except OSError as e:
             logger.warning(f"Failed to save key index: {e}")
 
@@ -73,11 +119,9 @@ class GoogleAiStudioProvider(BaseProvider):
         if not self.api_keys:
             raise RuntimeError("No API keys available")
 
-        # Ensure index is within bounds
-        self.current_key_index = self.current_key_index % len(self.api_keys)
-        key = self.api_keys[self.current_key_index]
+        key = self.api_keys[self._current_key_index]
 
-        logger.info(f"Using Google API key index: {self.current_key_index + 1}")
+        logger.info(f"Using Google API key index: {self._current_key_index + 1}")
         return key
 
     def _rotate_to_next_key(self):
@@ -87,7 +131,7 @@ class GoogleAiStudioProvider(BaseProvider):
             return
 
         old_index = self.current_key_index
-        self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+        self.current_key_index = old_index + 1
         self._save_key_index()
 
         logger.info(
@@ -9,6 +9,9 @@ from core.config import ConfigManager
 
 console = Console()
 
+_TASK_STATUS_DIRS = ("Inbox", "Backlog", "Sprint", "Done")
+_VALID_STATUSES = frozenset({"inbox", "backlog", "sprint", "done"})
+
 
 class ObsidianVaultIntegration:
     """Integration with Obsidian vault for markdown file synchronization."""
@@ -17,6 +20,7 @@ class ObsidianVaultIntegration:
         self.base_path = Path(base_path)
         self.config_manager = ConfigManager(self.base_path / "config")
         self._vault_path: Path | None = None
+        self._layout_ready = False
 
     @property
     def vault_path(self) -> Path | None:
@@ -36,6 +40,19 @@ class ObsidianVaultIntegration:
         """Check if Obsidian integration is enabled and configured."""
         return self.vault_path is not None and self.vault_path.exists()
 
+    def _ensure_vault_layout(self) -> Path:
+        """Create the Nexus CLI folder layout in the vault once per instance."""
+        vault_nexus_dir = self.vault_path / "Nexus CLI"
+        if not self._layout_ready:
+            for status_dir in _TASK_STATUS_DIRS:
+                (vault_nexus_dir / "Tasks" / status_dir).mkdir(
+                    parents=True, exist_ok=True
+                )
+            for name in ("Documentation", "Releases", "Feedback"):
+                (vault_nexus_dir / name).mkdir(exist_ok=True)
+            self._layout_ready = True
+        return vault_nexus_dir
+
     async def sync_task_to_vault(self, task_file: Path) -> bool:
         """Sync a task markdown file to the Obsidian vault."""
         if not self.is_enabled():
@@ -43,14 +60,13 @@ class ObsidianVaultIntegration:
             return False
 
         try:
-            # Create vault structure if it doesn't exist
-            vault_tasks_dir = self.vault_path / "Nexus CLI" / "Tasks"
-            vault_tasks_dir.mkdir(parents=True, exist_ok=True)
+            vault_tasks_dir = self._ensure_vault_layout() / "Tasks"
 
             # Determine target directory based on task status
             task_status = self._get_task_status_from_path(task_file)
             target_dir = vault_tasks_dir / task_status.title()
-            target_dir.mkdir(exist_ok=True)
+            if task_status == "unknown":
+                target_dir.mkdir(exist_ok=True)
 
             # Copy task file to vault
             target_file = target_dir / task_file.name
@@ -74,9 +90,7 @@ class ObsidianVaultIntegration:
                 console.log("No roadmap file to sync")
                 return False
 
-            # Create vault docs directory
-            vault_docs_dir = self.vault_path / "Nexus CLI" / "Documentation"
-            vault_docs_dir.mkdir(parents=True, exist_ok=True)
+            vault_docs_dir = self._ensure_vault_layout() / "Documentation"
 
             # Copy roadmap to vault
             target_file = vault_docs_dir / "ROADMAP.md"
@@ -100,9 +114,9 @@ class ObsidianVaultIntegration:
                 console.log(f"No release directory found: {release_dir}")
                 return False
 
-            # Create vault releases directory
-            vault_releases_dir = self.vault_path / "Nexus CLI" / "Releases" / version
-            vault_releases_dir.mkdir(parents=True, exist_ok=True)
+            # Create the per-version releases directory
+            vault_releases_dir = self._ensure_vault_layout() / "Releases" / version
+            vault_releases_dir.mkdir(exist_ok=True)
 
             # Sync all markdown files in release directory
             synced_files = []
@@ -132,9 +146,7 @@ class ObsidianVaultIntegration:
             if not feedback_dir.exists():
                 return True  # No feedback to sync
 
-            # Create vault feedback directory
-            vault_feedback_dir = self.vault_path / "Nexus CLI" / "Feedback"
-            vault_feedback_dir.mkdir(parents=True, exist_ok=True)
+            vault_feedback_dir = self._ensure_vault_layout() / "Feedback"
 
             # Sync all feedback files
             synced_count = 0
@@ -159,8 +171,7 @@ class ObsidianVaultIntegration:
             return False
 
         try:
-            vault_nexus_dir = self.vault_path / "Nexus CLI"
-            vault_nexus_dir.mkdir(exist_ok=True)
+            vault_nexus_dir = self._ensure_vault_layout()
 
             # Create index content
             from datetime import datetime
@@ -246,9 +257,7 @@ Nexus CLI/
         """Extract task status from file path."""
         # Look at the parent directory name to determine status
         parent = task_file.parent.name
-        if parent in ["inbox", "backlog", "sprint", "done"]:
-            return parent
-        return "unknown"
+        return parent if parent in _VALID_STATUSES else "unknown"
 
     async def full_sync(self) -> bool:
         """Perform a full synchronization of all content to the vault."""
@@ -257,6 +266,7 @@ Nexus CLI/
             return False
 
         console.log("Starting full vault synchronization...")
+        self._ensure_vault_layout()
 
         success_count = 0
         total_operations = 0
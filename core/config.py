@@ -9,6 +9,22 @@ from typing import Any
 import yaml
 from pydantic import BaseModel
 
+# Parsed TOML documents keyed by path, tagged with the file's mtime_ns
+_TOML_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+
+def _load_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file, reusing the previous parse while it is unchanged."""
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _TOML_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _TOML_CACHE[path] = (mtime_ns, data)
+    return data
+
 
 class ProviderConfig(BaseModel):
     """Provider configuration."""
@@ -17,6 +33,8 @@ class ProviderConfig(BaseModel):
     providers: list[str]
     model: str
     budgets: dict[str, float]
+    # Delay before the next provider is raced against a slow one; 0 = sequential
+    hedge_ms: int = 0
 
 
 class DiscordSettings(BaseModel):
@@ -40,6 +58,7 @@ class Settings(BaseModel):
     use_paid_models: bool = True
     watch_interval: float = 1.0
     max_concurrent_tasks: int = 5
+    parallel_roles: list[list[str]] = []
     timeout: float = 30.0
     max_retries: int = 3
 
@@ -79,10 +98,10 @@ class ConfigManager:
         if self._settings is None:
             settings_file = self.config_dir / "settings.toml"
             if settings_file.exists():
-                with open(settings_file, "rb") as f:
-                    data = tomllib.load(f)
+                data = _load_toml(settings_file)
 
-                # Expand environment variables
+                # Expand environment variables (returns fresh containers, so
+                # the cached parse is never mutated)
                 data = self._expand_env_vars(data)
 
                 # Handle nested configuration properly
@@ -96,6 +115,7 @@ class ConfigManager:
                     "use_paid_models",
                     "watch_interval",
                     "max_concurrent_tasks",
+                    "parallel_roles",
                     "timeout",
                     "max_retries",
                 ]:
@@ -119,6 +139,10 @@ class ConfigManager:
 
         return self._settings
 
+    def invalidate_settings(self) -> None:
+        """Drop memoized settings so the next get_settings() re-expands env vars."""
+        self._settings = None
+
     def get_roles(self) -> dict[str, ProviderConfig]:
         """Get role configurations."""
         if self._roles is None:
@@ -164,6 +188,14 @@ class ConfigManager:
 
         return self._provider_routes
 
+    @property
+    def config(self) -> dict[str, Any]:
+        """Model routing configuration: legacy models and provider routes."""
+        return {
+            "models": self.get_models(),
+            "provider_routes": self.get_provider_routes(),
+        }
+
     def get_role_config(self, role: str) -> ProviderConfig | None:
         """Get configuration for a specific role."""
         return self.get_roles().get(role)
@@ -8,10 +8,11 @@ _ = load_dotenv(".env.local", override=False)
 
 import asyncio
 import os
+import time
 from pathlib import Path
 
 from rich.console import Console
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 from .config import ConfigManager
@@ -23,6 +24,49 @@ import httpx
 
 console = Console()
 
+_PROVIDER_KEYS = (
+    "DEEPSEEK_API_KEY",
+    "OPENROUTER_API_KEY",
+    "QWEN_API_KEY",
+)
+
+# Editors emit bursts of modify events per save; collapse them
+_DUPLICATE_EVENT_WINDOW = 0.05
+# Paths remembered for duplicate detection before stale entries are pruned
+_LAST_SEEN_MAX = 256
+_UPDATE_DEBOUNCE_DELAY = 0.25
+
+_DEFAULT_ROLES = "communications,project_manager,senior_dev,junior_dev,release_qa"
+
+# Instructions for each pipeline role; unknown roles get the fallback
+_DEFAULT_INSTRUCTIONS = {
+    "communications": "Review the idea and create/normalize the task card, updating the roadmap if needed.",
+    "project_manager": "Triage and scope this task. Add or refine acceptance criteria and move it through planning.",
+    "senior_dev": "Assess complexity, outline the approach, and create any necessary subtasks.",
+    "junior_dev": "Implement the next actionable step or utility according to the plan.",
+    "release_qa": "Add validation steps and ensure release notes are updated if changes are user-facing.",
+}
+_FALLBACK_INSTRUCTION = "Proceed with your responsibilities for this task."
+
+_PROMPT_TMPL = """
+Task: {title}
+Description: {description}
+Current Status: {status}
+
+Instruction: {instruction}
+
+Please process this task according to your role as {role}.
+"""
+
+# Per-agent environment variables overriding the webhook avatar
+_AVATAR_ENV_KEYS = {
+    "communications": "COMMUNICATIONS_WEBHOOK_AVATAR",
+    "project_manager": "PM_WEBHOOK_AVATAR",
+    "senior_dev": "SD_WEBHOOK_AVATAR",
+    "junior_dev": "JD_WEBHOOK_AVATAR",
+    "release_qa": "RQE_WEBHOOK_AVATAR",
+}
+
 
 def _mask(value: object | None) -> str:
     """Mask sensitive values for logging."""
@@ -31,55 +75,54 @@ def _mask(value: object | None) -> str:
     s = str(value)
     if not s:
         return "Not configured"
-    return (s[:4] + "…" + s[-4:]) if len(s) > 8 else "****"
+    return f"{s[:4]}…{s[-4:]}" if len(s) > 8 else "****"
 
 
-class TaskFileHandler(FileSystemEventHandler):
+class TaskFileHandler(PatternMatchingEventHandler):
     """Handles file system events for task files."""
 
     def __init__(self, orchestrator: "Orchestrator"):
+        # Let watchdog drop directories and editor sidecar files before dispatch
+        super().__init__(
+            patterns=["*.md"],
+            ignore_patterns=["*.tmp", "*.swp", "*~"],
+            ignore_directories=True,
+        )
         self.orchestrator = orchestrator
+        # Watchdog always calls us from its observer thread, so every event is
+        # handed to the orchestrator's loop through call_soon_threadsafe.
+        if orchestrator._schedule is None:
+            raise RuntimeError(
+                "Orchestrator has no event loop yet; pass one in or call start()"
+            )
+        self._schedule = orchestrator._schedule
+        self._coro_new = orchestrator.process_new_task
+        self._coro_update = orchestrator.process_task_update
+        # Time each path last had an update scheduled
+        self._last_seen: dict[str, float] = {}
 
     def on_created(self, event):
         """Handle file creation events."""
-        if not event.is_directory and event.src_path.endswith(".md"):
-            loop = getattr(self.orchestrator, "loop", None)
-            if loop and loop.is_running():
-                asyncio.run_coroutine_threadsafe(
-                    self.orchestrator.process_new_task(Path(event.src_path)), loop
-                )
-            else:
-                try:
-                    loop = asyncio.get_running_loop()
-                    loop.call_soon_threadsafe(
-                        asyncio.create_task,
-                        self.orchestrator.process_new_task(Path(event.src_path)),
-                    )
-                except RuntimeError:
-                    # As a last resort, run synchronously in this thread
-                    asyncio.run(
-                        self.orchestrator.process_new_task(Path(event.src_path))
-                    )
+        self._schedule(asyncio.create_task, self._coro_new(event.src_path))
 
     def on_modified(self, event):
         """Handle file modification events."""
-        if not event.is_directory and event.src_path.endswith(".md"):
-            loop = getattr(self.orchestrator, "loop", None)
-            if loop and loop.is_running():
-                asyncio.run_coroutine_threadsafe(
-                    self.orchestrator.process_task_update(Path(event.src_path)), loop
-                )
-            else:
-                try:
-                    loop = asyncio.get_running_loop()
-                    loop.call_soon_threadsafe(
-                        asyncio.create_task,
-                        self.orchestrator.process_task_update(Path(event.src_path)),
-                    )
-                except RuntimeError:
-                    asyncio.run(
-                        self.orchestrator.process_task_update(Path(event.src_path))
-                    )
+        src_path = event.src_path
+        # Drop duplicates of a recently scheduled event before paying for the
+        # cross-thread hop. Only scheduled events reset the window, so a long
+        # burst still gets through every 50ms; the update debounce (longer
+        # than this window) then fires after the burst's last event.
+        now = time.monotonic()
+        last = self._last_seen.get(src_path)
+        if last is not None and now - last < _DUPLICATE_EVENT_WINDOW:
+            return
+        if len(self._last_seen) >= _LAST_SEEN_MAX:
+            cutoff = now - _DUPLICATE_EVENT_WINDOW
+            self._last_seen = {
+                path: seen for path, seen in self._last_seen.items() if seen >= cutoff
+            }
+        self._last_seen[src_path] = now
+        self._schedule(asyncio.create_task, self._coro_update(src_path))
 
 
 class Orchestrator:
@@ -93,8 +136,63 @@ class Orchestrator:
         self.observer: Observer | None = None
         self.running = False
         self.loop: asyncio.AbstractEventLoop | None = loop
+        # Thread-safe scheduler onto self.loop, bound once the loop is known
+        self._schedule = loop.call_soon_threadsafe if loop is not None else None
+        # Debounced task-update callbacks keyed by file path
+        self._pending_updates: dict[str, asyncio.TimerHandle] = {}
+        # Shared client for webhook posts, created on first use
+        self._http: httpx.AsyncClient | None = None
+        self.invalidate_env_cache()
         self._log_startup_config()
 
+    def invalidate_env_cache(self) -> None:
+        """Re-read settings and environment values cached for the hot paths."""
+        # get_settings() memoizes its env-expanded result; drop it so webhook
+        # URLs pick up environment changes too
+        self.config_manager.invalidate_settings()
+        settings = self.config_manager.get_settings()
+        self._webhook_urls: dict[str, str] = {
+            agent: url
+            for agent, url in (settings.discord.webhooks or {}).items()
+            if url and not url.startswith("${")
+        }
+        self._avatar_env: dict[str, str] = {
+            agent: value
+            for agent, key in _AVATAR_ENV_KEYS.items()
+            if (value := os.getenv(key))
+        }
+        roles_env = os.getenv("ORCHESTRATOR_ROLES", _DEFAULT_ROLES)
+        self._roles: list[str] = [
+            r.strip() for r in roles_env.split(",") if r.strip()
+        ]
+        self._pipeline: list[tuple[str, str]] = [
+            (role, _DEFAULT_INSTRUCTIONS.get(role, _FALLBACK_INSTRUCTION))
+            for role in self._roles
+        ]
+        self._stages = self._build_stages(settings.parallel_roles)
+
+    def _build_stages(
+        self, parallel_roles: list[list[str]]
+    ) -> list[list[tuple[str, str]]]:
+        """Split the pipeline into stages of roles that may run concurrently.
+
+        Adjacent pipeline roles that share a ``parallel_roles`` group form one
+        stage; every other role runs in a stage of its own.
+        """
+        group_of = {
+            role: index for index, group in enumerate(parallel_roles) for role in group
+        }
+        stages: list[list[tuple[str, str]]] = []
+        last_group = None
+        for role, instruction in self._pipeline:
+            group = group_of.get(role)
+            if stages and group is not None and group == last_group:
+                stages[-1].append((role, instruction))
+            else:
+                stages.append([(role, instruction)])
+            last_group = group
+        return stages
+
     def _log_startup_config(self) -> None:
         """Log masked orchestrator configuration and provider status."""
         settings = self.config_manager.get_settings()
@@ -102,15 +200,8 @@ class Orchestrator:
         console.log(f"  Project: {settings.project_name}")
         console.log(f"  Log Level: {settings.log_level}")
         console.log(f"  Obsidian: {settings.obsidian_path or 'Not configured'}")
-        providers = self.router.get_available_providers()
-        console.log(f"  Providers available: {len(providers)}")
         # Masked provider API keys presence
-        provider_keys = [
-            "DEEPSEEK_API_KEY",
-            "OPENROUTER_API_KEY",
-            "QWEN_API_KEY",
-        ]
-        masked = [f"{k}={_mask(os.getenv(k))}" for k in provider_keys if os.getenv(k)]
+        masked = [f"{k}={_mask(v)}" for k in _PROVIDER_KEYS if (v := os.getenv(k))]
         console.log(f"  Provider Keys: {', '.join(masked) or 'None'}")
 
     async def start(self):
@@ -119,6 +210,10 @@ class Orchestrator:
         # Capture running loop for thread-safe scheduling from watchdog threads
         if self.loop is None:
             self.loop = asyncio.get_running_loop()
+        self._schedule = self.loop.call_soon_threadsafe
+
+        providers = await self.router.get_available_providers()
+        console.log(f"Providers available: {len(providers)}")
 
         # Set up file watching
         self.observer = Observer()
@@ -152,30 +247,51 @@ class Orchestrator:
             self.observer.stop()
             self.observer.join()
 
+        for handle in self._pending_updates.values():
+            handle.cancel()
+        self._pending_updates.clear()
+
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def process_existing_inbox_tasks(self):
         """Process any existing tasks in the inbox."""
         inbox_tasks = self.task_queue.list_tasks(TaskStatus.INBOX)
         for task in inbox_tasks:
             await self.process_task_promotion(task)
 
-    async def process_new_task(self, file_path: Path):
-        """Process a newly created task file."""
+    async def process_new_task(self, file_path: str):
+        """Process a newly created task file.
+
+        Caller must ensure the path is directly under the inbox; the observer
+        only watches that directory, non-recursively.
+        """
         try:
-            if file_path.parent.name == "inbox":
-                with open(file_path) as f:
-                    content = f.read()
+            with open(file_path) as f:
+                content = f.read()
 
-                task = Task.from_markdown(content)
-                await self.process_task_promotion(task)
+            task = Task.from_markdown(content)
+            await self.process_task_promotion(task)
 
         except Exception as e:
             console.log(f"Error processing new task {file_path}: {e}")
 
-    async def process_task_update(self, file_path: Path):
-        """Process updates to existing task files."""
+    async def process_task_update(self, file_path: str):
+        """Schedule handling of a task file update, restarting any pending timer."""
+        handle = self._pending_updates.pop(file_path, None)
+        if handle is not None:
+            handle.cancel()
+        self._pending_updates[file_path] = asyncio.get_running_loop().call_later(
+            _UPDATE_DEBOUNCE_DELAY, self._do_task_update, file_path
+        )
+
+    def _do_task_update(self, file_path: str):
+        """Handle a task file update once its burst of events has settled."""
+        self._pending_updates.pop(file_path, None)
         try:
             # For now, just log the update
-            console.log(f"Task updated: {file_path.name}")
+            console.log(f"Task updated: {os.path.basename(file_path)}")
         except Exception as e:
             console.log(f"Error processing task update {file_path}: {e}")
 
@@ -195,53 +311,19 @@ class Orchestrator:
                 )
 
                 # Process pipeline of roles (each runs once per task)
-                # Allow overriding pipeline via env (comma-separated roles)
-                roles_env = os.getenv(
-                    "ORCHESTRATOR_ROLES",
-                    "communications,project_manager,senior_dev,junior_dev,release_qa",
-                )
-                roles = [r.strip() for r in roles_env.split(",") if r.strip()]
-                default_instructions = {
-                    "communications": "Review the idea and create/normalize the task card, updating the roadmap if needed.",
-                    "project_manager": "Triage and scope this task. Add or refine acceptance criteria and move it through planning.",
-                    "senior_dev": "Assess complexity, outline the approach, and create any necessary subtasks.",
-                    "junior_dev": "Implement the next actionable step or utility according to the plan.",
-                    "release_qa": "Add validation steps and ensure release notes are updated if changes are user-facing.",
+                processed = {
+                    a.agent for a in task.activity if a.action.startswith("processed by")
                 }
-                pipeline: list[tuple[str, str]] = [
-                    (role, default_instructions.get(role, "Proceed with your responsibilities for this task."))
-                    for role in roles
-                ]
-                    (
-                        "communications",
-                        "Review the idea and create/normalize the task card, updating the roadmap if needed.",
-                    ),
-                    (
-                        "project_manager",
-                        "Triage and scope this task. Add or refine acceptance criteria and move it through planning.",
-                    ),
-                    (
-                        "senior_dev",
-                        "Assess complexity, outline the approach, and create any necessary subtasks.",
-                    ),
-                    (
-                        "junior_dev",
-                        "Implement the next actionable step or utility according to the plan.",
-                    ),
-                    (
-                        "release_qa",
-                        "Add validation steps and ensure release notes are updated if changes are user-facing.",
-                    ),
-                ]
-
-                for role, instruction in pipeline:
-                    # Skip roles already processed for this task
-                    if any(
-                        a.agent == role and a.action.startswith("processed by")
-                        for a in task.activity
-                    ):
-                        continue
-                    await self.route_to_agent(role, task, instruction)
+                # Task writes happen synchronously inside route_to_agent, so
+                # concurrent roles in a stage cannot interleave a save
+                for stage in self._stages:
+                    await asyncio.gather(
+                        *(
+                            self.route_to_agent(role, task, instruction)
+                            for role, instruction in stage
+                            if role not in processed
+                        )
+                    )
 
         except Exception as e:
             console.log(f"Error promoting task {task.id}: {e}")
@@ -251,15 +333,15 @@ class Orchestrator:
     ) -> str | None:
         """Route a task to a specific agent role."""
         try:
-            prompt = f"""
-Task: {task.title}
-Description: {task.description}
-Current Status: {task.status.value}
-
-Instruction: {instruction}
-
-Please process this task according to your role as {role}.
-"""
+            prompt = _PROMPT_TMPL.format_map(
+                {
+                    "title": task.title,
+                    "description": task.description,
+                    "status": task.status.value,
+                    "instruction": instruction,
+                    "role": role,
+                }
+            )
 
             result = await self.router.complete(role, prompt)
 
@@ -293,9 +375,8 @@ Please process this task according to your role as {role}.
         This does not require the bot; it uses the webhook URLs from settings.
         """
         try:
-            settings = self.config_manager.get_settings()
-            webhook_url = (settings.discord.webhooks or {}).get(agent)
-            if not webhook_url or webhook_url.startswith("${"):
+            webhook_url = self._webhook_urls.get(agent)
+            if not webhook_url:
                 return
             # Display names and avatar URLs can be overridden per message
             agent_names = {
@@ -305,28 +386,26 @@ Please process this task according to your role as {role}.
                 "junior_dev": "Junior Developer",
                 "release_qa": "Release QA",
             }
-            avatar_env = {
-                "communications": os.getenv("COMMUNICATIONS_WEBHOOK_AVATAR"),
-                "project_manager": os.getenv("PM_WEBHOOK_AVATAR"),
-                "senior_dev": os.getenv("SD_WEBHOOK_AVATAR"),
-                "junior_dev": os.getenv("JD_WEBHOOK_AVATAR"),
-                "release_qa": os.getenv("RQE_WEBHOOK_AVATAR"),
-            }
             payload = {
                 "content": content[:2000],
                 "username": agent_names.get(agent, agent.replace("_", " ").title()),
             }
-            if avatar_env.get(agent):
-                payload["avatar_url"] = avatar_env[agent]
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                await client.post(webhook_url, json=payload)
+            avatar_url = self._avatar_env.get(agent)
+            if avatar_url:
+                payload["avatar_url"] = avatar_url
+            if self._http is None:
+                self._http = httpx.AsyncClient(
+                    timeout=10.0,
+                    limits=httpx.Limits(max_keepalive_connections=10),
+                )
+            await self._http.post(webhook_url, json=payload)
         except Exception as e:
             console.log(f"Webhook post failed for {agent}: {e}")
 
-    def get_status(self) -> dict:
+    async def get_status(self) -> dict:
         """Get current system status."""
         queue_counts = self.task_queue.get_queue_counts()
-        available_providers = self.router.get_available_providers()
+        available_providers = await self.router.get_available_providers()
 
         return {
             "running": self.running,
@@ -1,5 +1,6 @@
 """File-backed task queue implementation."""
 
+import os
 from pathlib import Path
 
 from rich.console import Console
@@ -25,40 +26,61 @@ class TaskQueue:
         for queue_dir in self.queues.values():
             queue_dir.mkdir(parents=True, exist_ok=True)
 
+        # task_id -> file path, built with one scandir per queue. Other queue
+        # instances (agents, bot) and users write task files too, so lookups
+        # validate entries and fall back to a directory scan on a miss.
+        self._index: dict[str, Path] = {}
+        for queue_dir in self.queues.values():
+            with os.scandir(queue_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md"):
+                        self._index[entry.name.split("_", 1)[0]] = Path(entry.path)
+
+        # Parsed tasks keyed by file path, tagged with (st_mtime_ns, st_size)
+        self._task_cache: dict[Path, tuple[tuple[int, int], Task]] = {}
+
+        # Task file counts per queue, tagged with the directory's st_mtime_ns
+        self._counts: dict[TaskStatus, tuple[int, int]] = {}
+
     def add_task(self, task: Task, status: TaskStatus | None = None) -> Path:
         """Add a task to the specified queue."""
         if status:
             task.status = status
 
         queue_dir = self.queues[task.status]
-        filename = f"{task.id}_{task.title.lower().replace(' ', '_')}.md"
+        filename = f"{task.id}_{task.slug}.md"
         file_path = queue_dir / filename
 
         with open(file_path, "w") as f:
             f.write(task.to_markdown())
+        self._index[task.id] = file_path
 
         console.log(f"Added task {task.id} to {task.status.value}")
         return file_path
 
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID from any queue."""
-        for status, queue_dir in self.queues.items():
-            for file_path in queue_dir.glob(f"{task_id}_*.md"):
-                return self._load_task_from_file(file_path)
-        return None
+        file_path = self._find_task_file(task_id)
+        if file_path is None:
+            return None
+        return self._load_task_from_file(file_path)
 
     def list_tasks(self, status: TaskStatus) -> list[Task]:
         """List all tasks in a specific queue."""
         tasks = []
         queue_dir = self.queues[status]
 
-        for file_path in queue_dir.glob("*.md"):
-            try:
-                task = self._load_task_from_file(file_path)
-                if task:
-                    tasks.append(task)
-            except Exception as e:
-                console.log(f"Error loading task from {file_path}: {e}")
+        with os.scandir(queue_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md"):
+                    continue
+                file_path = Path(entry.path)
+                try:
+                    task = self._load_task_from_file(file_path, entry.stat())
+                    if task:
+                        tasks.append(task)
+                except Exception as e:
+                    console.log(f"Error loading task from {file_path}: {e}")
 
         return sorted(tasks, key=lambda t: t.created_at)
 
@@ -78,6 +100,8 @@ class TaskQueue:
         old_file = self._find_task_file(task_id)
         if old_file:
             old_file.unlink()
+            del self._index[task_id]
+            self._task_cache.pop(old_file, None)
 
         # Update task status and add activity
         old_status = task.status
@@ -100,30 +124,57 @@ class TaskQueue:
         old_file = self._find_task_file(task.id)
         if old_file:
             old_file.unlink()
+            del self._index[task.id]
+            self._task_cache.pop(old_file, None)
 
         # Save updated task
         return self.add_task(task)
 
-    def _load_task_from_file(self, file_path: Path) -> Task | None:
-        """Load a task from a markdown file."""
+    def _load_task_from_file(
+        self, file_path: Path, stat: os.stat_result | None = None
+    ) -> Task | None:
+        """Load a task from a markdown file, reusing the last parse if unchanged."""
         try:
-            with open(file_path) as f:
-                content = f.read()
-            return Task.from_markdown(content)
+            if stat is None:
+                stat = file_path.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = self._task_cache.get(file_path)
+            if cached is None or cached[0] != version:
+                task = Task.from_markdown(file_path.read_text())
+                self._task_cache[file_path] = (version, task)
+            else:
+                task = cached[1]
+            # Callers mutate and re-save tasks; hand out copies
+            return task.model_copy(deep=True)
         except Exception as e:
             console.log(f"Error loading task from {file_path}: {e}")
             return None
 
     def _find_task_file(self, task_id: str) -> Path | None:
         """Find the file containing a specific task."""
+        file_path = self._index.get(task_id)
+        if file_path is not None and file_path.exists():
+            return file_path
+
         for queue_dir in self.queues.values():
             for file_path in queue_dir.glob(f"{task_id}_*.md"):
+                self._index[task_id] = file_path
                 return file_path
+
+        self._index.pop(task_id, None)
         return None
 
     def get_queue_counts(self) -> dict:
         """Get count of tasks in each queue."""
         counts = {}
         for status, queue_dir in self.queues.items():
-            counts[status.value] = len(list(queue_dir.glob("*.md")))
+            # Adding or removing an entry bumps the directory mtime, so the
+            # cached count stays valid for files written by other processes
+            dir_mtime = queue_dir.stat().st_mtime_ns
+            cached = self._counts.get(status)
+            if cached is None or cached[0] != dir_mtime:
+                with os.scandir(queue_dir) as entries:
+                    count = sum(1 for e in entries if e.name.endswith(".md"))
+                cached = self._counts[status] = (dir_mtime, count)
+            counts[status.value] = cached[1]
         return counts
@@ -2,81 +2,176 @@
 
 import logging
 import time
-from collections import defaultdict, deque
+from bisect import bisect_left
+from collections import defaultdict
 from pathlib import Path
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed limits files keyed by path, tagged with the file's mtime_ns
+_LIMITS_CACHE: dict[Path, tuple[int, dict]] = {}
+
+
+class _Window:
+    """Time-ordered (timestamp, amount) entries that keep a running total.
+
+    Entries live in parallel lists of timestamps and cumulative amounts behind
+    a head index, so expiring any number of entries is a bisect and a head
+    move rather than a pop per entry. The consumed prefix is released in one
+    slice once it outgrows the live part.
+    """
+
+    __slots__ = ("_base", "_cumulative", "_head", "_times")
+
+    def __init__(self):
+        self._times: list[float] = []
+        self._cumulative: list[int] = []
+        self._head = 0
+        # Cumulative amount of every entry before the head
+        self._base = 0
+
+    def __len__(self) -> int:
+        return len(self._times) - self._head
+
+    def __getitem__(self, index: int) -> tuple[float, int]:
+        i = self._head + index
+        if index < 0 or i >= len(self._times):
+            raise IndexError("window index out of range")
+        previous = self._cumulative[i - 1] if i > self._head else self._base
+        return self._times[i], self._cumulative[i] - previous
+
+    @property
+    def total(self) -> int:
+        """Sum of the amounts currently in the window."""
+        return self._cumulative[-1] - self._base if len(self) else 0
+
+    def append(self, entry: tuple[float, int]):
+        timestamp, amount = entry
+        last = self._cumulative[-1] if self._cumulative else self._base
+        self._times.append(timestamp)
+        self._cumulative.append(last + amount)
+
+    def evict_before(self, cutoff: float):
+        """Drop entries with a timestamp before the cutoff."""
+        head = bisect_left(self._times, cutoff, self._head)
+        if head == self._head:
+            return
+        self._base = self._cumulative[head - 1]
+        self._head = head
+        if head * 2 > len(self._times):
+            del self._times[:head]
+            del self._cumulative[:head]
+            self._head = 0
+
+    def clear(self):
+        self._times.clear()
+        self._cumulative.clear()
+        self._head = 0
+        self._base = 0
+
 
 class RateLimiter:
     """Per-model rate limiter with RPM and TPM tracking."""
 
     def __init__(self, limits_config_path: str = "config/limits.yaml"):
         self.limits_config_path = Path(limits_config_path)
-        self.limits = self._load_limits()
+        self._init_state(self._load_limits())
 
-        # Track requests and tokens per model
-        # Format: {model_id: deque([(timestamp, token_count), ...])}
-        self.request_history: dict[str, deque] = defaultdict(lambda: deque())
-        self.token_history: dict[str, deque] = defaultdict(lambda: deque())
+    @classmethod
+    def from_dict(cls, limits: dict) -> "RateLimiter":
+        """Build a rate limiter from an already-parsed limits mapping."""
+        limiter = cls.__new__(cls)
+        limiter.limits_config_path = None
+        limiter._init_state(limits or {})
+        return limiter
+
+    def _init_state(self, limits: dict):
+        """Index the limits and start with empty request windows."""
+        self.limits = limits
+
+        self._flatten_limits()
+
+        # Track requests and tokens per model; one entry per request, so the
+        # request count is the window length and the token count its total
+        # Format: {model_id: _Window([(timestamp, token_count), ...])}
+        self.request_history: dict[str, _Window] = defaultdict(_Window)
 
         # Window size for rate limiting (60 seconds)
         self.window_size = 60.0
 
     def _load_limits(self) -> dict:
         """Load rate limits from configuration file."""
-        if not self.limits_config_path.exists():
-            logger.warning(
-                f"Limits config not found at {self.limits_config_path}, using defaults"
-            )
+        path = self.limits_config_path
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.warning(f"Limits config not found at {path}, using defaults")
             return {}
 
+        # Routers and agents each build a RateLimiter; parse the file once
+        cached = _LIMITS_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
-            with open(self.limits_config_path) as f:
-                config = yaml.safe_load(f)
-                logger.info(f"Loaded rate limits from {self.limits_config_path}")
-                return config
+            with open(path) as f:
+                config = yaml.load(f, Loader=_SafeLoader) or {}  # noqa: S506
+            logger.info(f"Loaded rate limits from {path}")
+            _LIMITS_CACHE[path] = (mtime_ns, config)
+            return config
         except Exception as e:
             logger.error(f"Failed to load limits config: {e}")
             return {}
 
-    def _get_model_limits(self, provider: str, model_id: str) -> tuple[int, int]:
-        """Get RPM and TPM limits for a specific model."""
-        # Check provider-specific model limits
-        provider_config = self.limits.get("providers", {}).get(provider, {})
-        model_limits = provider_config.get("models", {}).get(model_id)
+    def _flatten_limits(self):
+        """Index the loaded limits as (provider, model_id) -> (rpm, tpm)."""
+        self._flat_limits: dict[tuple[str, str], tuple[int, int]] = {}
+        for provider, provider_config in self.limits.get("providers", {}).items():
+            models = (provider_config or {}).get("models", {})
+            for model_id, model_limits in models.items():
+                if model_limits:
+                    self._flat_limits[(provider, model_id)] = (
+                        model_limits.get("rpm", 0),
+                        model_limits.get("tpm", 0),
+                    )
 
-        if model_limits:
-            rpm = model_limits.get("rpm", 0)
-            tpm = model_limits.get("tpm", 0)
-            return rpm, tpm
+        defaults = self.limits.get("default_limits") or {}
+        self._default = (defaults.get("rpm", 60), defaults.get("tpm", 10000))
+        # Without a default_limits section, only listed models are enforced
+        self._has_defaults = bool(defaults)
 
-        # Fall back to default limits
-        defaults = self.limits.get("default_limits", {})
-        rpm = defaults.get("rpm", 60)
-        tpm = defaults.get("tpm", 10000)
+    def _get_model_limits(self, provider: str, model_id: str) -> tuple[int, int]:
+        """Get RPM and TPM limits for a specific model."""
+        return self._flat_limits.get((provider, model_id), self._default)
 
-        return rpm, tpm
+    def _is_unlimited(self, provider: str, model_id: str) -> bool:
+        """Check whether no RPM or TPM limit is enforced for a provider/model pair."""
+        limits = self._flat_limits.get((provider, model_id))
+        if limits is None:
+            if not self._has_defaults:
+                return True
+            limits = self._default
+        return limits[0] <= 0 and limits[1] <= 0
 
-    def _cleanup_old_entries(self, history: deque, current_time: float):
+    def _cleanup_old_entries(self, history: _Window, current_time: float):
         """Remove entries older than the window size."""
-        cutoff_time = current_time - self.window_size
-        while history and history[0][0] < cutoff_time:
-            history.popleft()
+        history.evict_before(current_time - self.window_size)
 
-    def _count_requests_in_window(self, model_id: str, current_time: float) -> int:
-        """Count requests for a model in the current window."""
+    def _window(self, model_id: str, current_time: float) -> _Window:
+        """Get a model's request history with expired entries removed."""
         history = self.request_history[model_id]
         self._cleanup_old_entries(history, current_time)
-        return len(history)
+        return history
 
-    def _count_tokens_in_window(self, model_id: str, current_time: float) -> int:
-        """Count tokens for a model in the current window."""
-        history = self.token_history[model_id]
-        self._cleanup_old_entries(history, current_time)
-        return sum(entry[1] for entry in history)
+    def _stats_in_window(self, model_id: str, current_time: float) -> tuple[int, int]:
+        """Get (request_count, token_count) for a model in the current window."""
+        history = self._window(model_id, current_time)
+        return len(history), history.total
 
     def check_limits(
         self, provider: str, model_id: str, estimated_tokens: int = 1000
@@ -89,19 +184,20 @@ class RateLimiter:
             - sleep_time: Seconds to wait if request is not allowed
 
         """
-        current_time = time.time()
-        rpm_limit, tpm_limit = self._get_model_limits(provider, model_id)
-
         # Skip rate limiting if limits are 0 or not configured
-        if rpm_limit <= 0 and tpm_limit <= 0:
+        if self._is_unlimited(provider, model_id):
             return True, None
 
+        current_time = time.monotonic()
+        rpm_limit, tpm_limit = self._get_model_limits(provider, model_id)
+        history = self._window(model_id, current_time)
+
         # Check RPM limit
         if rpm_limit > 0:
-            current_requests = self._count_requests_in_window(model_id, current_time)
+            current_requests = len(history)
             if current_requests >= rpm_limit:
                 # Calculate sleep time until oldest request falls out of window
-                oldest_request_time = self.request_history[model_id][0][0]
+                oldest_request_time = history[0][0]
                 sleep_time = (oldest_request_time + self.window_size) - current_time
                 logger.warning(
                     f"RPM limit exceeded for {model_id}: {current_requests}/{rpm_limit}"
@@ -110,15 +206,11 @@ class RateLimiter:
 
         # Check TPM limit
         if tpm_limit > 0:
-            current_tokens = self._count_tokens_in_window(model_id, current_time)
+            current_tokens = history.total
             if current_tokens + estimated_tokens > tpm_limit:
                 # Calculate sleep time until enough tokens fall out of window
                 # This is a simplified approach - we'll wait for the oldest entry
-                oldest_token_time = (
-                    self.token_history[model_id][0][0]
-                    if self.token_history[model_id]
-                    else current_time
-                )
+                oldest_token_time = history[0][0] if history else current_time
                 sleep_time = (oldest_token_time + self.window_size) - current_time
                 logger.warning(
                     f"TPM limit would be exceeded for {model_id}: {current_tokens + estimated_tokens}/{tpm_limit}"
@@ -129,18 +221,20 @@ class RateLimiter:
 
     def record_request(self, provider: str, model_id: str, token_count: int):
         """Record a successful request and its token usage."""
-        current_time = time.time()
+        # Unlimited models are never checked, so keep no history for them
+        if self._is_unlimited(provider, model_id):
+            return
 
-        # Record the request
-        self.request_history[model_id].append((current_time, 1))
+        rpm_limit, tpm_limit = self._get_model_limits(provider, model_id)
+        current_time = time.monotonic()
 
-        # Record the token usage
-        self.token_history[model_id].append((current_time, token_count))
+        # Record the request and its token usage
+        self.request_history[model_id].append((current_time, token_count))
 
         # Log current usage
-        rpm_limit, tpm_limit = self._get_model_limits(provider, model_id)
-        current_requests = self._count_requests_in_window(model_id, current_time)
-        current_tokens = self._count_tokens_in_window(model_id, current_time)
+        current_requests, current_tokens = self._stats_in_window(
+            model_id, current_time
+        )
 
         logger.debug(
             f"Rate limiter - {model_id}: {current_requests}/{rpm_limit} RPM, {current_tokens}/{tpm_limit} TPM"
@@ -148,10 +242,14 @@ class RateLimiter:
 
     def get_current_usage(self, provider: str, model_id: str) -> dict[str, int]:
         """Get current usage statistics for a model."""
-        current_time = time.time()
-        current_requests = self._count_requests_in_window(model_id, current_time)
-        current_tokens = self._count_tokens_in_window(model_id, current_time)
-        rpm_limit, tpm_limit = self._get_model_limits(provider, model_id)
+        if self._is_unlimited(provider, model_id):
+            # Nothing is recorded or enforced for unlimited models
+            current_requests = current_tokens = rpm_limit = tpm_limit = 0
+        else:
+            current_requests, current_tokens = self._stats_in_window(
+                model_id, time.monotonic()
+            )
+            rpm_limit, tpm_limit = self._get_model_limits(provider, model_id)
 
         return {
             "current_requests": current_requests,
@@ -1,5 +1,7 @@
 """Provider routing with fallback logic."""
 
+import asyncio
+import functools
 import logging
 import os
 import time
@@ -18,56 +20,180 @@ from connectors.providers import (
     TogetherProvider,
 )
 
-from .config import ConfigManager
+from .config import ConfigManager, ProviderConfig
 from .rate_limiter import RateLimiter
 
 console = Console()
 logger = logging.getLogger(__name__)
 
 
+def _resolve_tier(cfg: dict) -> str:
+    """Resolve a route or model tier, deriving it from is_paid when unset."""
+    tier = cfg.get("tier") or ("performance" if cfg.get("is_paid") else "free")
+    return tier.lower()
+
+
+_ALL_TIERS = frozenset({"free", "cheap", "budget", "performance", "ultra"})
+
+# Providers treated as free regardless of the model they serve
+_FREE_PROVIDERS = frozenset({"claude_code", "codex_cli", "google_ai_studio"})
+
+# Providers whose availability check spawns a CLI subprocess
+_SUBPROCESS_PROVIDERS = frozenset({"claude_code", "codex_cli"})
+
+
+@functools.lru_cache(maxsize=8)
+def _allowed_tiers(allowed_env: str | None, use_paid_env: str) -> frozenset[str]:
+    """Parse the tier gating env vars into the set of allowed tiers."""
+    if allowed_env:
+        return frozenset(
+            t.strip().lower() for t in allowed_env.split(",") if t.strip()
+        )
+    return _ALL_TIERS if use_paid_env.lower() == "true" else frozenset({"free"})
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) without splitting the text."""
+    return (len(text) + 3) >> 2
+
+
+def _completion_tokens(prompt: str, result: str) -> int:
+    """Estimate the tokens a completion used, weighting the response higher."""
+    return _estimate_tokens(prompt) + int(_estimate_tokens(result) * 1.3)
+
+
+# Provider name -> implementation, shared by routing and availability probes
+_PROVIDER_CLASSES: dict[str, type[BaseProvider]] = {
+    "claude_code": ClaudeCodeProvider,
+    "codex_cli": CodexCliProvider,
+    "deepseek": DeepseekProvider,
+    "google_ai_studio": GoogleAiStudioProvider,
+    "groq": GroqProvider,
+    "openrouter": OpenrouterProvider,
+    "qwen": QwenProvider,
+    "together": TogetherProvider,
+}
+
+# Consecutive failures that open a (provider, model) circuit, and how long it
+# stays open before the provider is tried again, in seconds
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30.0
+
+# How long a provider availability scan is reused, in seconds
+_AVAILABILITY_TTL = 30.0
+
+
+def _probe(name: str, provider_class: type[BaseProvider]) -> str | None:
+    """Return the provider name if it can be built and reports available."""
+    try:
+        if provider_class("test-model").is_available():
+            return name
+    except Exception:
+        pass
+    return None
+
+
 class ProviderRouter:
     """Routes requests to appropriate providers with fallback logic."""
 
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
-        self._provider_cache: dict[str, BaseProvider] = {}
+        self._provider_cache: dict[tuple[str, str], BaseProvider] = {}
         self.rate_limiter = RateLimiter()
+        self._available_cache: tuple[float, list[str]] | None = None
+        # Role configs and route lookup tables are derived from the config on
+        # first use and tagged with the config version they were built from
+        self._config_version = 0
+        self._role_cache: dict[str, tuple[int, ProviderConfig | None]] = {}
+        self._route_by_id: dict[str, dict] = {}
+        self._route_version = -1
+        self._route_tiers: dict[tuple[str, str], str] = {}
+        self._model_tiers: dict[str, str] = {}
+        # Circuit breaker state: (provider, model) -> (failures, open-until)
+        self._breaker: dict[tuple[str, str], tuple[int, float]] = {}
+
+    def bump_config_version(self):
+        """Invalidate cached role configs and route indexes after a config reload."""
+        self._config_version += 1
+
+    def _build_route_index(self) -> dict[str, dict]:
+        """Index provider routes by id and tiers by (id, provider) and model id."""
+        config = self.config_manager.config
+        route_by_id: dict[str, dict] = {}
+        route_tiers: dict[tuple[str, str], str] = {}
+        for route in config.get("provider_routes", []) or []:
+            route_id = route.get("id")
+            if not route_id:
+                continue
+            # First matching route wins, as with the previous linear scan
+            route_by_id.setdefault(route_id, route)
+            route_tiers.setdefault(
+                (route_id, route.get("provider")), _resolve_tier(route)
+            )
+        self._route_tiers = route_tiers
+        self._model_tiers = {
+            model_id: _resolve_tier(cfg or {})
+            for model_id, cfg in (config.get("models", {}) or {}).items()
+        }
+        self._route_by_id = route_by_id
+        self._route_version = self._config_version
+        return route_by_id
+
+    def _routes(self) -> dict[str, dict]:
+        """Get the provider route index, building it if needed."""
+        if self._route_version != self._config_version:
+            return self._build_route_index()
+        return self._route_by_id
+
+    def _role_config(self, role: str) -> ProviderConfig | None:
+        """Get a role's configuration, cached until the config version changes."""
+        version, role_config = self._role_cache.get(role, (-1, None))
+        if version != self._config_version:
+            role_config = self.config_manager.get_role_config(role)
+            self._role_cache[role] = (self._config_version, role_config)
+        return role_config
 
     def _get_provider(self, provider_name: str, model_name: str) -> BaseProvider | None:
         """Get a provider instance."""
-        cache_key = f"{provider_name}:{model_name}"
-
-        if cache_key not in self._provider_cache:
-            provider_class_map = {
-                "claude_code": ClaudeCodeProvider,
-                "codex_cli": CodexCliProvider,
-                "deepseek": DeepseekProvider,
-                "google_ai_studio": GoogleAiStudioProvider,
-                "groq": GroqProvider,
-                "openrouter": OpenrouterProvider,
-                "qwen": QwenProvider,
-                "together": TogetherProvider,
-            }
-
-            provider_class = provider_class_map.get(provider_name)
-            if not provider_class:
-                console.log(f"Unknown provider: {provider_name}")
-                return None
+        cache_key = (provider_name, model_name)
+        provider = self._provider_cache.get(cache_key)
+        if provider is not None:
+            return provider
+
+        provider_class = _PROVIDER_CLASSES.get(provider_name)
+        if not provider_class:
+            console.log(f"Unknown provider: {provider_name}")
+            return None
 
-            try:
-                # Special handling for Google AI Studio provider
-                if provider_name == "google_ai_studio":
-                    provider = provider_class(
-                        model_name
-                    )  # Uses environment variables internally
-                else:
-                    provider = provider_class(model_name)
-                self._provider_cache[cache_key] = provider
-            except Exception as e:
-                console.log(f"Failed to create provider {provider_name}: {e}")
-                return None
+        try:
+            # Google AI Studio reads its keys from the environment internally
+            provider = provider_class(model_name)
+        except Exception as e:
+            console.log(f"Failed to create provider {provider_name}: {e}")
+            return None
 
-        return self._provider_cache[cache_key]
+        self._provider_cache[cache_key] = provider
+        return provider
+
+    def _circuit_open(self, provider_name: str, model_name: str) -> bool:
+        """Check whether a provider/model pair is cooling down after failures."""
+        state = self._breaker.get((provider_name, model_name))
+        return state is not None and time.monotonic() < state[1]
+
+    def _record_failure(self, provider_name: str, model_name: str):
+        """Count a failed attempt, opening the circuit at the threshold."""
+        key = (provider_name, model_name)
+        failures = self._breaker.get(key, (0, 0.0))[0] + 1
+        open_until = 0.0
+        if failures >= _BREAKER_THRESHOLD:
+            open_until = time.monotonic() + _BREAKER_COOLDOWN
+            logger.warning(
+                "Circuit open for %s on %s after %d failures",
+                model_name,
+                provider_name,
+                failures,
+            )
+        self._breaker[key] = (failures, open_until)
 
     def _should_skip_paid_provider(self, provider_name: str, model_id: str) -> bool:
         """Tier-based gating for models/providers with backward compatibility.
@@ -77,34 +203,22 @@ class ProviderRouter:
         USE_PAID_MODELS (false => only 'free').
         Special-case providers considered free: claude_code, codex_cli, google_ai_studio.
         """
-        allowed_env = os.getenv("ALLOWED_MODEL_TIERS")
-        if allowed_env:
-            allowed_tiers = [t.strip().lower() for t in allowed_env.split(",") if t.strip()]
-        else:
-            use_paid_models = os.getenv("USE_PAID_MODELS", "true").lower() == "true"
-            allowed_tiers = (
-                ["free", "cheap", "budget", "performance", "ultra"]
-                if use_paid_models
-                else ["free"]
-            )
+        # Env vars are read per call since they can change at runtime; parsing
+        # them into a tier set is memoized on their raw values
+        allowed_tiers = _allowed_tiers(
+            os.environ.get("ALLOWED_MODEL_TIERS"),
+            os.environ.get("USE_PAID_MODELS", "true"),
+        )
 
         # Provider-level free classification
-        if provider_name in {"claude_code", "codex_cli", "google_ai_studio"}:
+        if provider_name in _FREE_PROVIDERS:
             return "free" not in allowed_tiers
 
         # Resolve tier from provider_routes or legacy models
-        tier = None
-        provider_routes = self.config_manager.get_provider_routes()
-        for route in provider_routes:
-            if route.get("id") == model_id and route.get("provider") == provider_name:
-                tier = (route.get("tier") or ("free" if not route.get("is_paid") else "performance")).lower()
-                break
-
+        self._routes()
+        tier = self._route_tiers.get((model_id, provider_name))
         if tier is None:
-            models_config = self.config_manager.get_models()
-            if model_id in models_config:
-                cfg = models_config[model_id]
-                tier = (cfg.get("tier") or ("free" if not cfg.get("is_paid") else "performance")).lower()
+            tier = self._model_tiers.get(model_id)
 
         if tier is None:
             # Be permissive if we can't resolve tier
@@ -121,7 +235,7 @@ class ProviderRouter:
             return await self._complete_with_model(model_id, prompt)
 
         # Role-based routing (legacy)
-        role_config = self.config_manager.get_role_config(role)
+        role_config = self._role_config(role)
         if not role_config:
             console.log(f"No configuration found for role: {role}")
             return None
@@ -129,103 +243,229 @@ class ProviderRouter:
         # Cross-model fallback: try an ordered list of model IDs if provided
         model_chain = getattr(role_config, "model_chain", None)
         if model_chain:
-            for mid in model_chain:
-                try:
-                    res = await self._complete_with_model(mid, prompt)
-                    if res:
-                        return res
-                except Exception as e:
-                    console.log(f"Model {mid} failed: {e}, trying next in chain...")
-                    continue
-            console.log(f"All models in chain failed for role {role}")
-            return None
+            return await self._complete_chain(role, model_chain, prompt)
 
         model_name = role_config.model
 
-        # Try each provider in order
-        for provider_name in role_config.providers:
+        hedge_ms = getattr(role_config, "hedge_ms", 0) or 0
+        if hedge_ms > 0:
+            return await self._complete_hedged(
+                role, model_name, role_config.providers, prompt, hedge_ms / 1000
+            )
+
+        return await self._complete_sequential(
+            role, model_name, role_config.providers, prompt
+        )
+
+    async def _complete_chain(
+        self, role: str, model_chain: list[str], prompt: str
+    ) -> str | None:
+        """Try each model ID in order until one returns a response."""
+        for mid in model_chain:
             try:
-                # Skip if model tier not allowed
-                if self._should_skip_paid_provider(provider_name, model_name):
-                    console.log(
-                        f"Skipping {model_name} on {provider_name} (tier gated)"
-                    )
-                    continue
+                res = await self._complete_with_model(mid, prompt)
+                if res:
+                    return res
+            except Exception as e:
+                logger.debug("Model %s failed: %s, trying next in chain...", mid, e)
+                continue
+        console.log(f"All models in chain failed for role {role}")
+        return None
 
-                provider = self._get_provider(provider_name, model_name)
+    async def _complete_sequential(
+        self, role: str, model_name: str, provider_names: list[str], prompt: str
+    ) -> str | None:
+        """Try each provider in order until one returns a response."""
+        for provider_name in provider_names:
+            try:
+                provider = await self._ready_provider(provider_name, model_name)
                 if not provider:
                     continue
 
-                if not provider.is_available():
-                    console.log(
-                        f"Provider {provider_name} not available, trying next..."
-                    )
-                    continue
-
-                # Check rate limits
-                allowed, sleep_time = self.rate_limiter.check_limits(
-                    provider_name, model_name
-                )
-                if not allowed:
-                    if sleep_time and sleep_time > 0:
-                        logger.warning(
-                            f"Rate limit hit for {model_name}, sleeping {sleep_time:.1f}s"
-                        )
-                        time.sleep(sleep_time)
-                        # Re-check after sleep
-                        allowed, _ = self.rate_limiter.check_limits(
-                            provider_name, model_name
-                        )
-                        if not allowed:
-                            console.log(
-                                f"Rate limit still exceeded for {model_name}, trying next provider..."
-                            )
-                            continue
-                    else:
-                        console.log(
-                            f"Rate limit exceeded for {model_name}, trying next provider..."
-                        )
-                        continue
-
                 start_time = time.time()
-                console.log(f"Using provider {provider_name} for role {role}")
+                logger.debug("Using provider %s for role %s", provider_name, role)
                 result = await provider.complete(prompt)
-                latency = time.time() - start_time
-
-                # Record successful request
-                estimated_tokens = (
-                    len(prompt.split()) + len(result.split()) * 1.3
-                )  # Rough estimate
-                self.rate_limiter.record_request(
-                    provider_name, model_name, int(estimated_tokens)
+                self._record_completion(
+                    role,
+                    provider_name,
+                    model_name,
+                    _completion_tokens(prompt, result),
+                    time.time() - start_time,
                 )
-
-                # Log routing trace
-                console.log(f"✓ {provider_name} → {model_name} → {latency:.2f}s")
-
-                # Update budget tracking (simplified)
-                self._update_budget(role, int(estimated_tokens))
-
                 return result
 
             except Exception as e:
-                console.log(f"Provider {provider_name} failed: {e}, trying next...")
+                logger.debug("Provider %s failed: %s, trying next...", provider_name, e)
+                self._record_failure(provider_name, model_name)
                 continue
 
         console.log(f"All providers failed for role {role}")
         return None
 
-    async def _complete_with_model(self, model_id: str, prompt: str) -> str | None:
-        """Complete a prompt with a specific model ID from provider routes."""
-        provider_routes = self.config_manager.get_provider_routes()
+    async def _ready_provider(
+        self, provider_name: str, model_name: str, *, wait: bool = True
+    ) -> BaseProvider | None:
+        """Get a provider that passed tier, availability and rate-limit checks.
+
+        With wait=False a rate-limited provider is skipped instead of slept on.
+        """
+        if self._circuit_open(provider_name, model_name):
+            logger.debug(
+                "Circuit open for %s on %s, skipping", model_name, provider_name
+            )
+            return None
+
+        # Skip if model tier not allowed
+        if self._should_skip_paid_provider(provider_name, model_name):
+            console.log(f"Skipping {model_name} on {provider_name} (tier gated)")
+            return None
+
+        return await self._usable_provider(provider_name, model_name, wait=wait)
+
+    async def _usable_provider(
+        self, provider_name: str, model_name: str, *, wait: bool = True
+    ) -> BaseProvider | None:
+        """Get a provider instance that is available and within its rate limits."""
+        provider = self._get_provider(provider_name, model_name)
+        if not provider:
+            return None
+
+        # CLI providers probe with a subprocess; keep that off the loop. The
+        # API providers only check for a key, which is cheaper than a thread hop
+        if provider_name in _SUBPROCESS_PROVIDERS:
+            available = await asyncio.to_thread(provider.is_available)
+        else:
+            available = provider.is_available()
+        if not available:
+            logger.debug("Provider %s not available, trying next...", provider_name)
+            return None
+
+        if not await self._await_rate_limit(provider_name, model_name, wait=wait):
+            return None
+        return provider
+
+    async def _await_rate_limit(
+        self, provider_name: str, model_name: str, *, wait: bool = True
+    ) -> bool:
+        """Check rate limits, sleeping once if the limiter says when to retry."""
+        allowed, sleep_time = self.rate_limiter.check_limits(provider_name, model_name)
+        if allowed:
+            return True
+
+        if not wait or not sleep_time or sleep_time <= 0:
+            logger.debug(
+                "Rate limit exceeded for %s, trying next provider...", model_name
+            )
+            return False
+
+        logger.warning("Rate limit hit for %s, sleeping %.1fs", model_name, sleep_time)
+        await asyncio.sleep(sleep_time)
+        # Re-check after sleep
+        allowed, _ = self.rate_limiter.check_limits(provider_name, model_name)
+        if not allowed:
+            logger.debug(
+                "Rate limit still exceeded for %s, trying next provider...",
+                model_name,
+            )
+        return allowed
+
+    def _record_completion(
+        self,
+        role: str | None,
+        provider_name: str,
+        model_name: str,
+        estimated_tokens: int,
+        latency: float,
+    ):
+        """Record usage for a successful completion and log its trace."""
+        # Record successful request
+        self.rate_limiter.record_request(provider_name, model_name, estimated_tokens)
+        self._breaker.pop((provider_name, model_name), None)
+
+        # Routing trace and budget tracking go through the logger, which only
+        # formats them when debug output is enabled
+        logger.debug("✓ %s → %s → %.2fs", provider_name, model_name, latency)
+        if role:
+            self._update_budget(role, estimated_tokens)
+
+    async def _complete_hedged(
+        self,
+        role: str,
+        model_name: str,
+        provider_names: list[str],
+        prompt: str,
+        hedge_delay: float,
+    ) -> str | None:
+        """Run the provider chain with hedged requests.
+
+        The next provider is started whenever the in-flight ones have not
+        answered within hedge_delay seconds (or immediately once they have all
+        failed). The first successful response wins and the rest are cancelled.
+        Rate-limited providers are skipped rather than slept on, so a sleep
+        never holds up a response that is already in flight.
+        """
+        remaining = iter(provider_names)
+        in_flight: dict[asyncio.Task, tuple[str, float]] = {}
+
+        async def launch_next() -> bool:
+            for provider_name in remaining:
+                try:
+                    provider = await self._ready_provider(
+                        provider_name, model_name, wait=False
+                    )
+                except Exception as e:
+                    logger.debug(
+                        "Provider %s failed: %s, trying next...", provider_name, e
+                    )
+                    continue
+                if not provider:
+                    continue
+                logger.debug("Using provider %s for role %s", provider_name, role)
+                task = asyncio.create_task(provider.complete(prompt))
+                in_flight[task] = (provider_name, time.time())
+                return True
+            return False
+
+        try:
+            has_more = await launch_next()
+            while in_flight:
+                done, _ = await asyncio.wait(
+                    in_flight,
+                    timeout=hedge_delay if has_more else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    provider_name, start_time = in_flight.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.debug(
+                            "Provider %s failed: %s, trying next...", provider_name, e
+                        )
+                        self._record_failure(provider_name, model_name)
+                        continue
+                    self._record_completion(
+                        role,
+                        provider_name,
+                        model_name,
+                        _completion_tokens(prompt, result),
+                        time.time() - start_time,
+                    )
+                    return result
 
-        # Find the route for this model
-        route = None
-        for r in provider_routes:
-            if r.get("id") == model_id:
-                route = r
-                break
+                # Hedge timed out, or every in-flight request failed
+                if has_more:
+                    has_more = await launch_next()
+        finally:
+            for task in in_flight:
+                task.cancel()
 
+        console.log(f"All providers failed for role {role}")
+        return None
+
+    def _route_provider(self, model_id: str) -> str | None:
+        """Get the provider name a model ID is routed to."""
+        route = self._routes().get(model_id)
         if not route:
             console.log(f"No route found for model: {model_id}")
             return None
@@ -233,6 +473,12 @@ class ProviderRouter:
         provider_name = route.get("provider")
         if not provider_name:
             console.log(f"No provider specified for model: {model_id}")
+        return provider_name or None
+
+    async def _complete_with_model(self, model_id: str, prompt: str) -> str | None:
+        """Complete a prompt with a specific model ID from provider routes."""
+        provider_name = self._route_provider(model_id)
+        if not provider_name:
             return None
 
         # Skip if paid models are disabled and this is a paid model
@@ -240,56 +486,32 @@ class ProviderRouter:
             console.log(f"Skipping paid model {model_id} (USE_PAID_MODELS=false)")
             return None
 
+        if self._circuit_open(provider_name, model_id):
+            logger.debug("Circuit open for %s on %s, skipping", model_id, provider_name)
+            return None
+
         try:
-            provider = self._get_provider(provider_name, model_id)
+            provider = await self._usable_provider(provider_name, model_id)
             if not provider:
                 return None
 
-            if not provider.is_available():
-                console.log(
-                    f"Provider {provider_name} not available for model {model_id}"
-                )
-                return None
-
-            # Check rate limits
-            allowed, sleep_time = self.rate_limiter.check_limits(
-                provider_name, model_id
-            )
-            if not allowed:
-                if sleep_time and sleep_time > 0:
-                    logger.warning(
-                        f"Rate limit hit for {model_id}, sleeping {sleep_time:.1f}s"
-                    )
-                    time.sleep(sleep_time)
-                    # Re-check after sleep
-                    allowed, _ = self.rate_limiter.check_limits(provider_name, model_id)
-                    if not allowed:
-                        console.log(f"Rate limit still exceeded for {model_id}")
-                        return None
-                else:
-                    console.log(f"Rate limit exceeded for {model_id}")
-                    return None
-
             start_time = time.time()
-            console.log(f"Using {provider_name} for model {model_id}")
+            logger.debug("Using %s for model %s", provider_name, model_id)
             result = await provider.complete(prompt)
-            latency = time.time() - start_time
-
-            # Record successful request
-            estimated_tokens = (
-                len(prompt.split()) + len(result.split()) * 1.3
-            )  # Rough estimate
-            self.rate_limiter.record_request(
-                provider_name, model_id, int(estimated_tokens)
+            self._record_completion(
+                None,
+                provider_name,
+                model_id,
+                _completion_tokens(prompt, result),
+                time.time() - start_time,
             )
-
-            # Log routing trace
-            console.log(f"✓ {provider_name} → {model_id} → {latency:.2f}s")
-
             return result
 
         except Exception as e:
-            console.log(f"Provider {provider_name} failed for model {model_id}: {e}")
+            logger.debug(
+                "Provider %s failed for model %s: %s", provider_name, model_id, e
+            )
+            self._record_failure(provider_name, model_id)
             return None
 
     def _update_budget(self, role: str, token_count: int):
@@ -297,30 +519,27 @@ class ProviderRouter:
         # In a real implementation, this would update the budget in roles.yaml
         # For now, just log the usage
         estimated_cost = token_count * 0.001 / 1000  # Rough estimate
-        console.log(f"Role {role} used ~{token_count} tokens (${estimated_cost:.4f})")
-
-    def get_available_providers(self) -> list[str]:
-        """Get list of available providers."""
-        available = []
-
-        # Check each provider type
-        providers = [
-            ("claude_code", ClaudeCodeProvider),
-            ("codex_cli", CodexCliProvider),
-            ("deepseek", DeepseekProvider),
-            ("google_ai_studio", GoogleAiStudioProvider),
-            ("groq", GroqProvider),
-            ("openrouter", OpenrouterProvider),
-            ("qwen", QwenProvider),
-            ("together", TogetherProvider),
-        ]
-
-        for name, provider_class in providers:
-            try:
-                provider = provider_class("test-model")
-                if provider.is_available():
-                    available.append(name)
-            except Exception:
-                pass
+        logger.debug(
+            "Role %s used ~%d tokens ($%.4f)", role, token_count, estimated_cost
+        )
+
+    async def get_available_providers(self) -> list[str]:
+        """Get list of available providers.
+
+        Providers are probed concurrently in worker threads (CLI providers spawn
+        a subprocess), and the result is reused for a short TTL.
+        """
+        now = time.monotonic()
+        if self._available_cache and now - self._available_cache[0] < _AVAILABILITY_TTL:
+            return list(self._available_cache[1])
+
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(_probe, name, cls)
+                for name, cls in _PROVIDER_CLASSES.items()
+            )
+        )
+        available = [name for name in results if name]
 
-        return available
+        self._available_cache = (now, available)
+        return list(available)
@@ -1,14 +1,78 @@
 """Task models and state management."""
 
+import json
+import re
 import uuid
-from datetime import datetime
-from enum import Enum
+from datetime import UTC, datetime
+from enum import StrEnum
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# libyaml-backed loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Front matter block and the body after it
+_FRONT_MATTER_RE = re.compile(
+    r"\A---\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|\Z)(.*)\Z", re.DOTALL
+)
+# Characters json.dumps leaves raw that YAML cannot carry verbatim in a
+# double-quoted scalar: non-printables, the BOM and the line breaks YAML folds
+_YAML_UNSAFE_RE = re.compile(
+    "[^\t\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd"
+    "\U00010000-\U0010ffff]"
+)
+_BMP_MAX = 0xFFFF
+# Runs of characters not allowed in task file names
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Text between the "# Title" heading and the first "## " section
+_DESC_RE = re.compile(
+    r"^# [^\n]*(?:\n|\Z)(.*?)(?=^## |\Z)", re.DOTALL | re.MULTILINE
+)
+
+
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def _as_utc(value: datetime | str | None) -> datetime:
+    """Normalize a stored timestamp to aware UTC.
+
+    Task files written before timestamps were timezone-aware hold naive local
+    times; those are interpreted as local time so old and new tasks compare.
+    """
+    if value is None:
+        return _utcnow()
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.astimezone(UTC)
+
+
+def _escape_yaml_unsafe(match: re.Match) -> str:
+    code = ord(match.group())
+    return f"\\u{code:04x}" if code <= _BMP_MAX else f"\\U{code:08x}"
+
+
+def _dump_front_matter(front_matter: dict) -> str:
+    r"""Emit flat front matter as YAML, one JSON-encoded value per key.
+
+    JSON is valid YAML flow syntax, and its string escapes (\n, \", \uXXXX)
+    mean the same inside YAML double-quoted scalars, so multi-line values keep
+    the same layout. Characters JSON leaves raw but YAML would reject or fold
+    are escaped as well.
+    """
+    return "".join(
+        f"{key}: "
+        + _YAML_UNSAFE_RE.sub(
+            _escape_yaml_unsafe, json.dumps(value, ensure_ascii=False)
+        )
+        + "\n"
+        for key, value in front_matter.items()
+    )
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(StrEnum):
     """Task status enumeration."""
 
     INBOX = "inbox"
@@ -20,6 +84,8 @@ class TaskStatus(str, Enum):
 class ActivityEntry(BaseModel):
     """Activity log entry for task transitions."""
 
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     timestamp: datetime
     action: str
     agent: str
@@ -29,6 +95,10 @@ class ActivityEntry(BaseModel):
 class Task(BaseModel):
     """Task model with front matter and markdown content."""
 
+    # Validation happens once at construction; field updates such as
+    # status changes and updated_at bumps are plain attribute writes
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
     title: str
     description: str
@@ -37,18 +107,23 @@ class Task(BaseModel):
     tags: list[str] = Field(default_factory=list)
     assigned_agent: str | None = None
     acceptance_criteria: list[str] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     activity: list[ActivityEntry] = Field(default_factory=list)
 
+    @property
+    def slug(self) -> str:
+        """Filesystem-safe form of the title used in task file names."""
+        # Not cached: title can be reassigned and must not leave a stale name
+        return _SLUG_RE.sub("_", self.title.lower()).strip("_")
+
     def add_activity(self, action: str, agent: str, details: str | None = None):
         """Add an activity entry."""
+        now = _utcnow()
         self.activity.append(
-            ActivityEntry(
-                timestamp=datetime.now(), action=action, agent=agent, details=details
-            )
+            ActivityEntry(timestamp=now, action=action, agent=agent, details=details)
         )
-        self.updated_at = datetime.now()
+        self.updated_at = now
 
     def to_markdown(self) -> str:
         """Convert task to markdown format with front matter."""
@@ -63,27 +138,42 @@ class Task(BaseModel):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
-
-        content = f"---\n{yaml.dump(front_matter, default_flow_style=False)}---\n\n"
-        content += f"# {self.title}\n\n"
-        content += f"{self.description}\n\n"
+        if self.activity:
+            front_matter["activity"] = [
+                {
+                    "timestamp": entry.timestamp.isoformat(),
+                    "action": entry.action,
+                    "agent": entry.agent,
+                    "details": entry.details,
+                }
+                for entry in self.activity
+            ]
+
+        parts = [
+            "---\n",
+            _dump_front_matter(front_matter),
+            "---\n\n# ",
+            self.title,
+            "\n\n",
+            self.description,
+            "\n\n",
+        ]
 
         if self.acceptance_criteria:
-            content += "## Acceptance Criteria\n\n"
-            for criterion in self.acceptance_criteria:
-                content += f"- {criterion}\n"
-            content += "\n"
+            parts.append("## Acceptance Criteria\n\n")
+            parts.extend(f"- {criterion}\n" for criterion in self.acceptance_criteria)
+            parts.append("\n")
 
         if self.activity:
-            content += "## Activity\n\n"
+            parts.append("## Activity\n\n")
             for entry in self.activity:
-                timestamp = entry.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                content += f"- **{timestamp}** [{entry.agent}] {entry.action}"
+                timestamp = entry.timestamp.isoformat(sep=" ", timespec="seconds")
+                parts.append(f"- **{timestamp}** [{entry.agent}] {entry.action}")
                 if entry.details:
-                    content += f": {entry.details}"
-                content += "\n"
+                    parts.append(f": {entry.details}")
+                parts.append("\n")
 
-        return content
+        return "".join(parts)
 
     @classmethod
     def from_markdown(cls, content: str) -> "Task":
@@ -96,34 +186,23 @@ class Task(BaseModel):
             return cls(title=title, description=description)
 
         # Parse front matter
-        parts = content.split("---", 2)
-        if len(parts) < 3:
+        match = _FRONT_MATTER_RE.match(content)
+        if not match:
             raise ValueError("Invalid markdown format")
 
-        front_matter = yaml.safe_load(parts[1])
-        markdown_content = parts[2].strip()
+        front_matter = yaml.load(match.group(1), Loader=_Loader) or {}  # noqa: S506
 
         # Extract description from markdown content
-        lines = markdown_content.split("\n")
-        description_lines = []
-        in_description = False
-
-        for line in lines:
-            if line.startswith("# "):
-                in_description = True
-                continue
-            elif line.startswith("## "):
-                break
-            elif in_description:
-                description_lines.append(line)
-
-        description = "\n".join(description_lines).strip()
+        desc_match = _DESC_RE.search(match.group(2))
+        description = desc_match.group(1).strip() if desc_match else ""
 
         # Parse activity entries
         activity = []
-        for entry_data in front_matter.get("activity", []):
+        for entry_data in front_matter.get("activity") or []:
             if isinstance(entry_data, dict):
-                activity.append(ActivityEntry(**entry_data))
+                entry = ActivityEntry(**entry_data)
+                entry.timestamp = _as_utc(entry.timestamp)
+                activity.append(entry)
 
         return cls(
             id=front_matter.get("id", str(uuid.uuid4())[:8]),
@@ -134,11 +213,7 @@ class Task(BaseModel):
             tags=front_matter.get("tags", []),
             assigned_agent=front_matter.get("assigned_agent"),
             acceptance_criteria=front_matter.get("acceptance_criteria", []),
-            created_at=datetime.fromisoformat(
-                front_matter.get("created_at", datetime.now().isoformat())
-            ),
-            updated_at=datetime.fromisoformat(
-                front_matter.get("updated_at", datetime.now().isoformat())
-            ),
+            created_at=_as_utc(front_matter.get("created_at")),
+            updated_at=_as_utc(front_matter.get("updated_at")),
             activity=activity,
         )
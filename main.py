@@ -2,6 +2,9 @@
 """Main entry point for Nexus CLI."""
 
 import asyncio
+import importlib
+import logging
+import os
 import sys
 from pathlib import Path
 
@@ -9,6 +12,18 @@ from rich.console import Console
 
 console = Console()
 
+# CLI shorthand -> agent package; agent modules are imported only when run
+_AGENT_COMMANDS = {
+    "comm": "communications",
+    "pm": "project_manager",
+    "senior": "senior_dev",
+    "junior": "junior_dev",
+    "qa": "release_qa",
+}
+_AGENT_MODULES = {
+    agent_name: f"agents.{agent_name}.main" for agent_name in _AGENT_COMMANDS.values()
+}
+
 
 async def main():
     """Main entry point with command routing."""
@@ -54,20 +69,8 @@ async def main():
         elif command == "status":
             await show_status(base_path)
 
-        elif command == "comm":
-            await run_agent_command("communications", sys.argv[2:])
-
-        elif command == "pm":
-            await run_agent_command("project_manager", sys.argv[2:])
-
-        elif command == "senior":
-            await run_agent_command("senior_dev", sys.argv[2:])
-
-        elif command == "junior":
-            await run_agent_command("junior_dev", sys.argv[2:])
-
-        elif command == "qa":
-            await run_agent_command("release_qa", sys.argv[2:])
+        elif command in _AGENT_COMMANDS:
+            await run_agent_command(_AGENT_COMMANDS[command], sys.argv[2:])
 
         else:
             console.log(f"Unknown command: {command}")
@@ -178,7 +181,7 @@ async def show_status(base_path: Path):
 
     # Available providers
     console.log("\n🔌 Available Providers:")
-    providers = router.get_available_providers()
+    providers = await router.get_available_providers()
     if providers:
         for provider in providers:
             console.log(f"  ✅ {provider}")
@@ -208,32 +211,27 @@ async def run_agent_command(agent_name: str, args: list):
         return
 
     # Import and run the agent's main function
-    module_name = f"agents.{agent_name}.main"
+    module_name = _AGENT_MODULES.get(agent_name)
+    if module_name is None:
+        console.log(f"Unknown agent: {agent_name}")
+        return
 
     try:
         # Temporarily modify sys.argv for the agent
         old_argv = sys.argv
         sys.argv = [f"{module_name}.py"] + args
 
-        if agent_name == "communications":
-            from agents.communications.main import main as agent_main
-        elif agent_name == "project_manager":
-            from agents.project_manager.main import main as agent_main
-        elif agent_name == "senior_dev":
-            from agents.senior_dev.main import main as agent_main
-        elif agent_name == "junior_dev":
-            from agents.junior_dev.main import main as agent_main
-        elif agent_name == "release_qa":
-            from agents.release_qa.main import main as agent_main
-        else:
-            console.log(f"Unknown agent: {agent_name}")
-            return
-
-        await agent_main()
+        agent_module = importlib.import_module(module_name)
+        await agent_module.main()
 
     finally:
         sys.argv = old_argv
 
 
 if __name__ == "__main__":
+    # Routing chatter is logged at DEBUG; LOG_LEVEL=DEBUG brings it back
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(levelname)s %(name)s: %(message)s",
+    )
     asyncio.run(main())
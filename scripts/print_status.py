@@ -2,6 +2,7 @@
 """Print current system status - queue counts and roadmap items."""
 
 import sys
+from collections import deque
 from pathlib import Path
 
 # Add project root to path
@@ -43,24 +44,23 @@ def main():
     if roadmap_path.exists():
         console.print("\n🗺️  [bold]Recent Roadmap Items:[/bold]")
         try:
-            with open(roadmap_path) as f:
-                lines = f.readlines()
-
-            recent_ideas = []
+            # Stream the file, keeping only the last 5 items of the section
+            recent_ideas: deque[str] = deque(maxlen=5)
             in_recent_section = False
 
-            for line in lines:
-                line = line.strip()
-                if "## Recent Ideas" in line:
-                    in_recent_section = True
-                    continue
-                elif line.startswith("## ") and in_recent_section:
-                    break
-                elif in_recent_section and line.startswith("- **"):
-                    recent_ideas.append(line)
+            with open(roadmap_path) as f:
+                for line in f:
+                    line = line.strip()
+                    if "## Recent Ideas" in line:
+                        in_recent_section = True
+                        continue
+                    elif line.startswith("## ") and in_recent_section:
+                        break
+                    elif in_recent_section and line.startswith("- **"):
+                        recent_ideas.append(line)
 
             if recent_ideas:
-                for idea in recent_ideas[-5:]:  # Last 5 items
+                for idea in recent_ideas:
                     console.print(f"  {idea}")
             else:
                 console.print("  No recent ideas")
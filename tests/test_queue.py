@@ -0,0 +1,106 @@
+"""Tests for the file-backed task queue and its caches."""
+
+import pytest
+
+from core.queue import TaskQueue
+from core.task import Task, TaskStatus
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Task queue rooted in a temporary directory."""
+    return TaskQueue(tmp_path)
+
+
+def _ids(tasks: list[Task]) -> set[str]:
+    return {task.id for task in tasks}
+
+
+class TestTaskQueueExternalChanges:
+    """Test that files changed by other writers are picked up."""
+
+    def test_external_add(self, queue, tmp_path):
+        """Test that a task added by another queue instance is visible."""
+        queue.get_queue_counts()
+        queue.list_tasks(TaskStatus.INBOX)
+
+        task = Task(title="From elsewhere", description="")
+        TaskQueue(tmp_path).add_task(task)
+
+        assert queue.get_task(task.id).title == "From elsewhere"
+        assert _ids(queue.list_tasks(TaskStatus.INBOX)) == {task.id}
+        assert queue.get_queue_counts()["inbox"] == 1
+
+    def test_external_rename(self, queue):
+        """Test that a task file moved between queues outside the queue is found."""
+        task = Task(title="Moving", description="")
+        path = queue.add_task(task)
+        queue.get_task(task.id)
+        queue.get_queue_counts()
+
+        path.rename(queue.queues[TaskStatus.BACKLOG] / path.name)
+
+        assert queue.get_task(task.id) is not None
+        assert queue._find_task_file(task.id).parent.name == "backlog"
+        assert queue.list_tasks(TaskStatus.INBOX) == []
+        assert _ids(queue.list_tasks(TaskStatus.BACKLOG)) == {task.id}
+        counts = queue.get_queue_counts()
+        assert (counts["inbox"], counts["backlog"]) == (0, 1)
+
+    def test_external_delete(self, queue):
+        """Test that a task file deleted outside the queue disappears."""
+        task = Task(title="Doomed", description="")
+        path = queue.add_task(task)
+        queue.get_task(task.id)
+        queue.list_tasks(TaskStatus.INBOX)
+        queue.get_queue_counts()
+
+        path.unlink()
+
+        assert queue.get_task(task.id) is None
+        assert queue.list_tasks(TaskStatus.INBOX) == []
+        assert queue.get_queue_counts()["inbox"] == 0
+
+    def test_same_size_edit(self, queue):
+        """Test that an edit that keeps the file size is not served from cache."""
+        task = Task(title="Edit me", description="", priority="low")
+        path = queue.add_task(task)
+        assert queue.get_task(task.id).priority == "low"
+
+        content = path.read_text()
+        edited = content.replace('priority: "low"', 'priority: "top"')
+        assert edited != content
+        assert len(edited) == len(content)
+        path.write_text(edited)
+
+        assert queue.get_task(task.id).priority == "top"
+        assert queue.list_tasks(TaskStatus.INBOX)[0].priority == "top"
+
+
+class TestTaskQueueCopies:
+    """Test that callers get tasks they can mutate freely."""
+
+    def test_get_task_returns_independent_copies(self, queue):
+        """Test that mutating a returned task leaves the cached parse intact."""
+        task = Task(title="Original", description="", tags=["a"])
+        queue.add_task(task)
+
+        first = queue.get_task(task.id)
+        first.title = "Mutated"
+        first.tags.append("b")
+        first.add_activity("touched", "test")
+
+        second = queue.get_task(task.id)
+        assert second.title == "Original"
+        assert second.tags == ["a"]
+        assert second.activity == []
+
+    def test_list_tasks_returns_independent_copies(self, queue):
+        """Test that tasks from list_tasks do not alias the cache either."""
+        task = Task(title="Listed", description="", tags=["a"])
+        queue.add_task(task)
+
+        queue.list_tasks(TaskStatus.INBOX)[0].tags.append("b")
+
+        assert queue.list_tasks(TaskStatus.INBOX)[0].tags == ["a"]
+        assert queue.get_task(task.id).tags == ["a"]
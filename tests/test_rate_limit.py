@@ -1,12 +1,15 @@
 """Tests for rate limiting functionality."""
 
+import random
 import tempfile
 import time
+from collections import deque
 from pathlib import Path
 
+import pytest
 import yaml
 
-from core.rate_limiter import RateLimiter
+from core.rate_limiter import RateLimiter, _Window
 
 
 class TestRateLimiter:
@@ -14,7 +17,6 @@ class TestRateLimiter:
 
     def setup_method(self):
         """Set up test fixtures."""
-        # Create a temporary limits config file
         self.temp_limits = {
             "providers": {
                 "test_provider": {
@@ -29,24 +31,21 @@ class TestRateLimiter:
             "default_limits": {"rpm": 60, "tpm": 10000},
         }
 
-        # Create temporary config file
-        self.temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        )
-        yaml.dump(self.temp_limits, self.temp_file)
-        self.temp_file.close()
-
-        self.rate_limiter = RateLimiter(self.temp_file.name)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        Path(self.temp_file.name).unlink(missing_ok=True)
+        self.rate_limiter = RateLimiter.from_dict(self.temp_limits)
 
     def test_load_limits_from_config(self):
         """Test loading limits from configuration file."""
-        rpm, tpm = self.rate_limiter._get_model_limits("test_provider", "test_model")
-        assert rpm == 1
-        assert tpm == 100
+        temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False)
+        yaml.dump(self.temp_limits, temp_file)
+        temp_file.close()
+
+        try:
+            limiter = RateLimiter(temp_file.name)
+            rpm, tpm = limiter._get_model_limits("test_provider", "test_model")
+            assert rpm == 1
+            assert tpm == 100
+        finally:
+            Path(temp_file.name).unlink(missing_ok=True)
 
     def test_get_default_limits(self):
         """Test fallback to default limits for unconfigured models."""
@@ -116,15 +115,12 @@ class TestRateLimiter:
 
         # Manually advance time by manipulating history
         # (In real tests, you'd use time mocking, but this is simpler for now)
-        current_time = time.time()
+        current_time = time.monotonic()
         old_time = current_time - 61  # 61 seconds ago (outside window)
 
-        # Replace the recent request with an old one
+        # Replace the recent request (and its tokens) with an old one
         self.rate_limiter.request_history[model].clear()
-        self.rate_limiter.request_history[model].append((old_time, 1))
-        # Also clear token history since both RPM and TPM limits apply
-        self.rate_limiter.token_history[model].clear()
-        self.rate_limiter.token_history[model].append((old_time, 50))
+        self.rate_limiter.request_history[model].append((old_time, 50))
 
         # Should now be allowed since old request is outside window
         allowed, _ = self.rate_limiter.check_limits(provider, model, estimated_tokens=50)
@@ -141,22 +137,15 @@ class TestRateLimiter:
             }
         }
 
-        temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False)
-        yaml.dump(zero_limits, temp_file)
-        temp_file.close()
-
-        try:
-            limiter = RateLimiter(temp_file.name)
+        limiter = RateLimiter.from_dict(zero_limits)
 
-            # Multiple requests should all be allowed
-            for i in range(10):
-                allowed, _ = limiter.check_limits(
-                    "unlimited_provider", "unlimited_model", 1000
-                )
-                assert allowed is True
-                limiter.record_request("unlimited_provider", "unlimited_model", 1000)
-        finally:
-            Path(temp_file.name).unlink(missing_ok=True)
+        # Multiple requests should all be allowed
+        for i in range(10):
+            allowed, _ = limiter.check_limits(
+                "unlimited_provider", "unlimited_model", 1000
+            )
+            assert allowed is True
+            limiter.record_request("unlimited_provider", "unlimited_model", 1000)
 
     def test_current_usage_tracking(self):
         """Test that current usage is tracked correctly."""
@@ -194,3 +183,90 @@ class TestRateLimiter:
         # model2 should still be allowed (different model)
         allowed, _ = self.rate_limiter.check_limits(provider, model2)
         assert allowed is True
+
+
+    def test_unlimited_pair_without_default_limits(self):
+        """Test that pairs without an entry or default_limits are never limited."""
+        limiter = RateLimiter.from_dict(
+            {"providers": {"limited": {"models": {"shared_model": {"rpm": 1}}}}}
+        )
+
+        for _ in range(3):
+            allowed, sleep_time = limiter.check_limits("other", "shared_model")
+            assert (allowed, sleep_time) == (True, None)
+            limiter.record_request("other", "shared_model", 500)
+
+        # Bypassed requests are not recorded against the shared model id
+        assert "shared_model" not in limiter.request_history
+        assert limiter.get_current_usage("other", "shared_model") == {
+            "current_requests": 0,
+            "rpm_limit": 0,
+            "current_tokens": 0,
+            "tpm_limit": 0,
+        }
+
+        # The explicitly limited pair is still enforced
+        limiter.record_request("limited", "shared_model", 10)
+        allowed, _ = limiter.check_limits("limited", "shared_model")
+        assert allowed is False
+        assert limiter.get_current_usage("limited", "shared_model")["rpm_limit"] == 1
+
+
+class TestWindow:
+    """Test _Window against a deque of (timestamp, amount) entries."""
+
+    def _assert_matches(self, window: _Window, reference: deque):
+        assert len(window) == len(reference)
+        assert window.total == sum(amount for _, amount in reference)
+        assert [window[i] for i in range(len(window))] == list(reference)
+        with pytest.raises(IndexError):
+            window[len(reference)]
+        with pytest.raises(IndexError):
+            window[-1]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_deque_reference(self, seed):
+        """Test random appends, evictions and clears against a deque."""
+        rng = random.Random(seed)
+        window = _Window()
+        reference: deque = deque()
+        now = 0.0
+        compactions = 0
+
+        for _ in range(500):
+            op = rng.random()
+            if op < 0.6:
+                # Equal timestamps exercise bisect_left at the cutoff
+                now += rng.choice((0.0, 0.5, 1.0, 3.0))
+                entry = (now, rng.randint(0, 50))
+                window.append(entry)
+                reference.append(entry)
+            elif op < 0.98:
+                # Cutoffs before, on and after stored timestamps
+                cutoff = now - rng.choice((-1.0, 0.0, 0.5, 1.0, 5.0, 20.0))
+                head = window._head
+                window.evict_before(cutoff)
+                # The head only moves back when the consumed prefix is dropped
+                if window._head < head:
+                    compactions += 1
+                while reference and reference[0][0] < cutoff:
+                    reference.popleft()
+            else:
+                window.clear()
+                reference.clear()
+            self._assert_matches(window, reference)
+
+        assert compactions > 0
+
+    def test_evict_everything_then_append(self):
+        """Test that a window emptied by eviction keeps counting from zero."""
+        window = _Window()
+        for t in range(5):
+            window.append((float(t), 10))
+        window.evict_before(10.0)
+        assert len(window) == 0
+        assert window.total == 0
+
+        window.append((11.0, 7))
+        assert window.total == 7
+        assert window[0] == (11.0, 7)
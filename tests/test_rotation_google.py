@@ -6,6 +6,7 @@ from unittest.mock import Mock, mock_open, patch
 import httpx
 import pytest
 
+from connectors.providers import google_ai_studio
 from connectors.providers.google_ai_studio import GoogleAiStudioProvider
 
 
@@ -164,3 +165,47 @@ class TestGoogleAiStudioRotation:
         with patch.dict("os.environ", {}, clear=True):
             with pytest.raises(RuntimeError, match="No Google API keys configured"):
                 GoogleAiStudioProvider("test-model")
+
+
+class TestGoogleAiStudioKeyIndexSaves:
+    """Test throttled key index persistence."""
+
+    def setup_method(self):
+        """Set up a provider and a fake monotonic clock."""
+        self.provider = GoogleAiStudioProvider("test-model", ["key1", "key2", "key3"])
+        self.clock = Mock()
+
+    def _save(self, index: int, at: float):
+        self.provider.current_key_index = index
+        self.clock.monotonic.return_value = at
+        with patch.object(google_ai_studio, "time", self.clock):
+            self.provider._save_key_index()
+
+    def _saved_index(self) -> int:
+        return json.loads(self.provider.key_index_file.read_text())["current_index"]
+
+    def test_deferred_save_flushed_by_next_save(self, tmp_path):
+        """Test that a save inside the interval is written by a later save."""
+        self.provider.key_index_file = tmp_path / "google_ai_studio.keyidx"
+
+        self._save(1, at=100.0)
+        self._save(2, at=100.5)
+        assert self._saved_index() == 1
+        assert self.provider in google_ai_studio._pending_saves
+
+        self._save(2, at=101.5)
+        assert self._saved_index() == 2
+        assert self.provider not in google_ai_studio._pending_saves
+
+    def test_deferred_save_flushed_at_exit(self, tmp_path):
+        """Test that the exit hook writes a save still pending."""
+        self.provider.key_index_file = tmp_path / "google_ai_studio.keyidx"
+
+        self._save(1, at=100.0)
+        self._save(2, at=100.2)
+        self._save(0, at=100.4)
+        assert self._saved_index() == 1
+
+        google_ai_studio._flush_pending_saves()
+        assert self._saved_index() == 0
+        assert self.provider not in google_ai_studio._pending_saves
@@ -0,0 +1,135 @@
+"""Tests for hedged requests in the router."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.config import ConfigManager
+from core.rate_limiter import RateLimiter
+from core.router import ProviderRouter
+
+
+class FakeProvider:
+    """Async provider stub that answers or fails after a delay."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    def is_available(self) -> bool:
+        return True
+
+    async def complete(self, prompt: str) -> str:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            msg = f"{self.name} failed"
+            raise RuntimeError(msg)
+        return f"{self.name}: {prompt}"
+
+
+class TestRouterHedging:
+    """Test hedged provider requests in ProviderRouter.complete."""
+
+    def setup_method(self):
+        """Set up a router with an unlimited rate limiter and no routes."""
+        self.config_manager = Mock(spec=ConfigManager)
+        self.config_manager.config = {}
+        self.router = ProviderRouter(self.config_manager)
+        self.router.rate_limiter = RateLimiter.from_dict({})
+
+    async def _complete(self, providers: list[FakeProvider], hedge_ms: int):
+        self.config_manager.get_role_config.return_value = SimpleNamespace(
+            model="test-model",
+            providers=[p.name for p in providers],
+            hedge_ms=hedge_ms,
+            model_chain=None,
+        )
+        by_name = {p.name: p for p in providers}
+        with (
+            patch.object(
+                self.router, "_get_provider", side_effect=lambda n, _m: by_name[n]
+            ),
+            patch("core.router.console"),
+        ):
+            return await asyncio.wait_for(self.router.complete("dev", "hi"), 2.0)
+
+    @pytest.mark.asyncio
+    async def test_slow_first_provider_loses_to_hedge(self):
+        """Test that a hedged second provider wins over a slow first one."""
+        slow = FakeProvider("slow", delay=5.0)
+        fast = FakeProvider("fast", delay=0.01)
+
+        result = await self._complete([slow, fast], hedge_ms=20)
+
+        assert result == "fast: hi"
+        assert slow.cancelled
+
+    @pytest.mark.asyncio
+    async def test_failed_first_provider_starts_next_immediately(self):
+        """Test that a failure launches the next provider without the hedge delay."""
+        broken = FakeProvider("broken", fail=True)
+        backup = FakeProvider("backup", delay=0.01)
+
+        # A hedge delay longer than the wait_for timeout proves it is not awaited
+        result = await self._complete([broken, backup], hedge_ms=10_000)
+
+        assert result == "backup: hi"
+        assert self.router._breaker[("broken", "test-model")][0] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_providers_fail(self):
+        """Test that None is returned when every provider fails."""
+        providers = [
+            FakeProvider("a", fail=True),
+            FakeProvider("b", delay=0.01, fail=True),
+        ]
+
+        result = await self._complete(providers, hedge_ms=5)
+
+        assert result is None
+        assert all(p.calls == 1 for p in providers)
+
+    @pytest.mark.asyncio
+    async def test_zero_hedge_stays_sequential(self):
+        """Test that hedge_ms=0 waits for the first provider without hedging."""
+        first = FakeProvider("first", delay=0.05)
+        second = FakeProvider("second")
+
+        result = await self._complete([first, second], hedge_ms=0)
+
+        assert result == "first: hi"
+        assert second.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_completion_leaves_no_background_tasks(self):
+        """Test that completing a request leaves no pending tasks behind."""
+        result = await self._complete([FakeProvider("only")], hedge_ms=0)
+
+        assert result == "only: hi"
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_hedge_does_not_sleep(self):
+        """Test that a rate-limited hedge is skipped instead of slept on."""
+        self.router.rate_limiter = RateLimiter.from_dict(
+            {"providers": {"limited": {"models": {"test-model": {"rpm": 1}}}}}
+        )
+        self.router.rate_limiter.record_request("limited", "test-model", 1)
+        first = FakeProvider("first", delay=0.1)
+        limited = FakeProvider("limited")
+
+        # Sleeping out the rate-limit window would trip the wait_for timeout
+        result = await self._complete([first, limited], hedge_ms=10)
+
+        assert result == "first: hi"
+        assert limited.calls == 0
@@ -0,0 +1,80 @@
+"""Tests for the task model and its markdown format."""
+
+from datetime import UTC
+
+from core.queue import TaskQueue
+from core.task import Task, TaskStatus
+
+
+class TestTaskSlug:
+    """Test task file name slugs."""
+
+    def test_slug_follows_title(self):
+        """Test that the slug reflects a reassigned title."""
+        task = Task(title="Hello World", description="")
+        assert task.slug == "hello_world"
+
+        task.title = "Renamed: Task!"
+        assert task.slug == "renamed_task"
+
+
+class TestTaskMarkdown:
+    """Test the markdown round trip."""
+
+    def test_round_trip_multiline_details(self):
+        """Test that multi-line and quoted values survive to_markdown/from_markdown."""
+        task = Task(
+            title='Fix "quoted": title',
+            description="First line.\n\nSecond paragraph.",
+            tags=["a: b", "- dash"],
+            acceptance_criteria=["line one\nline two"],
+        )
+        task.add_activity(
+            "failed", "dev", 'Traceback:\n  File "x.py"\n\tValueError: bad\u2028end'
+        )
+
+        parsed = Task.from_markdown(task.to_markdown())
+
+        assert parsed.title == task.title
+        assert parsed.description == task.description
+        assert parsed.tags == task.tags
+        assert parsed.acceptance_criteria == task.acceptance_criteria
+        assert parsed.activity[0].details == task.activity[0].details
+        assert parsed.activity[0].timestamp == task.activity[0].timestamp
+
+    def test_round_trip_empty_description_with_criteria(self):
+        """Test that an empty description does not swallow the next section."""
+        task = Task(title="X", description="", acceptance_criteria=["a", "b"])
+
+        parsed = Task.from_markdown(task.to_markdown())
+
+        assert parsed.description == ""
+        assert parsed.acceptance_criteria == ["a", "b"]
+
+    def test_legacy_naive_timestamps_load_as_utc(self, tmp_path):
+        """Test that naive timestamps from old task files sort with new tasks."""
+        queue = TaskQueue(tmp_path)
+        legacy = (
+            "---\n"
+            "id: legacy01\n"
+            "title: Legacy task\n"
+            "status: inbox\n"
+            "created_at: '2020-01-01T09:30:00'\n"
+            "updated_at: '2020-01-01T09:30:00'\n"
+            "activity:\n"
+            "- timestamp: '2020-01-01T09:30:00'\n"
+            "  action: created\n"
+            "  agent: user\n"
+            "---\n\n# Legacy task\n\nWritten before timestamps carried a zone.\n"
+        )
+        (queue.queues[TaskStatus.INBOX] / "legacy01_legacy_task.md").write_text(legacy)
+        new = Task(title="New task", description="")
+        queue.add_task(new)
+
+        tasks = queue.list_tasks(TaskStatus.INBOX)
+
+        assert [t.id for t in tasks] == ["legacy01", new.id]
+        for task in tasks:
+            assert task.created_at.tzinfo is UTC
+            assert task.updated_at.tzinfo is UTC
+        assert tasks[0].activity[0].timestamp.tzinfo is UTC
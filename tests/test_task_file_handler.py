@@ -0,0 +1,73 @@
+"""Tests for task file event filtering."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from watchdog.events import FileModifiedEvent
+
+from core import orchestrator as orchestrator_module
+from core.orchestrator import TaskFileHandler
+
+
+class TestTaskFileHandler:
+    """Test duplicate suppression in TaskFileHandler.on_modified."""
+
+    def setup_method(self):
+        """Set up a handler around a stub orchestrator."""
+        self.scheduled: list[str] = []
+        stub = SimpleNamespace(
+            _schedule=lambda _create_task, path: self.scheduled.append(path),
+            process_new_task=lambda path: path,
+            process_task_update=lambda path: path,
+        )
+        self.handler = TaskFileHandler(stub)
+        self.clock = Mock()
+
+    def _modify(self, path: str, at: float):
+        self.clock.monotonic.return_value = at
+        with patch.object(orchestrator_module, "time", self.clock):
+            self.handler.dispatch(FileModifiedEvent(path))
+
+    def test_duplicate_within_window_dropped(self):
+        """Test that a repeat event inside the window is not scheduled."""
+        self._modify("/tasks/inbox/a.md", 10.0)
+        self._modify("/tasks/inbox/a.md", 10.01)
+        assert self.scheduled == ["/tasks/inbox/a.md"]
+
+    def test_event_after_window_scheduled(self):
+        """Test that an event after the window is scheduled again."""
+        self._modify("/tasks/inbox/a.md", 10.0)
+        self._modify("/tasks/inbox/a.md", 10.06)
+        assert len(self.scheduled) == 2
+
+    def test_long_burst_not_suppressed(self):
+        """Test that a burst of closely spaced events keeps getting through."""
+        times = [10.0 + i * 0.01 for i in range(30)]
+        for at in times:
+            self._modify("/tasks/inbox/a.md", at)
+
+        # Dropped events never extend the window, so one event per 50ms is
+        # scheduled and the last scheduled one is within a window of the end
+        assert len(self.scheduled) >= 5
+        scheduled_at = self.handler._last_seen["/tasks/inbox/a.md"]
+        assert times[-1] - scheduled_at < orchestrator_module._DUPLICATE_EVENT_WINDOW
+
+    def test_paths_are_independent(self):
+        """Test that events for different files do not suppress each other."""
+        self._modify("/tasks/inbox/a.md", 10.0)
+        self._modify("/tasks/inbox/b.md", 10.01)
+        assert self.scheduled == ["/tasks/inbox/a.md", "/tasks/inbox/b.md"]
+
+    def test_non_markdown_ignored(self):
+        """Test that editor sidecar files are filtered out."""
+        self._modify("/tasks/inbox/a.md.swp", 10.0)
+        self._modify("/tasks/inbox/a.md~", 10.1)
+        assert self.scheduled == []
+
+    def test_last_seen_pruned(self):
+        """Test that stale paths are pruned from the duplicate tracker."""
+        limit = orchestrator_module._LAST_SEEN_MAX
+        for i in range(limit * 3):
+            self._modify(f"/tasks/inbox/{i}.md", 10.0 + i)
+        assert len(self.handler._last_seen) <= limit
+        assert len(self.scheduled) == limit * 3
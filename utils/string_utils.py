@@ -2,6 +2,25 @@
 
 import re
 import unicodedata
+from functools import lru_cache
+
+_DASH_RE = re.compile(r"-+")
+
+
+class _SlugTable(dict):
+    """Translate table for slugify.
+
+    Keeps [a-z0-9-], maps whitespace to "-" and drops everything else.
+    Codepoints outside the seed set are classified on first sight and memoized.
+    """
+
+    def __missing__(self, codepoint: int) -> str | None:
+        value = "-" if chr(codepoint).isspace() else None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789-"})
 
 
 def slugify(text: str, max_length: int = 50) -> str:
@@ -22,27 +41,33 @@ def slugify(text: str, max_length: int = 50) -> str:
         'my-awesome-project-2024'
 
     """
+    # Type-check before the cache, which would happily hash None or ints
     if not isinstance(text, str):
         raise TypeError("Input must be a string")
 
-    # Normalize unicode characters
-    text = unicodedata.normalize("NFKD", text)
+    return _slugify(text, max_length)
 
-    # Convert to lowercase and replace spaces with hyphens
-    text = text.lower().strip()
-    text = re.sub(r"\s+", "-", text)
 
-    # Remove all non-alphanumeric characters except hyphens
-    text = re.sub(r"[^a-z0-9-]", "", text)
+@lru_cache(maxsize=1024)
+def _slugify(text: str, max_length: int) -> str:
+    """Slugify a validated string; titles and ids repeat, so results are cached."""
+    # Normalize unicode characters (a no-op for pure ASCII, the common case)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+
+    # Lowercase, then in one pass turn whitespace into hyphens and drop
+    # everything that is not alphanumeric or a hyphen
+    text = text.lower().translate(_SLUG_TABLE)
 
     # Remove consecutive hyphens
-    text = re.sub(r"-+", "-", text)
+    text = _DASH_RE.sub("-", text)
 
     # Remove leading/trailing hyphens
     text = text.strip("-")
 
-    # Limit length
-    if len(text) > max_length:
-        text = text[:max_length].rstrip("-")
-
-    return text
+    # Limit length, backing off a trailing hyphen (runs are already collapsed,
+    # so this steps back at most once) to slice a single time
+    end = min(len(text), max_length)
+    while end > 0 and text[end - 1] == "-":
+        end -= 1
+    return text[:end]